@@ -5,8 +5,37 @@ import signal
 import sys
 from multiprocessing import Pool
 import json
+import copy
+import functools
+import hashlib
+import itertools
+import tempfile
+from collections import deque
 import yaml  # Add this import at the top
 from tqdm import tqdm  # Import tqdm for progress bar
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+# Prefer the libyaml-backed loader; the pure-Python one is several times slower
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+    print("[WARNING] PyYAML was built without libyaml; config loading will be slower")
+
+# Lowercase extensions (without the dot) of the videos picked up from a source folder
+VIDEO_EXTENSIONS = frozenset(("mp4", "mov"))
+
+# Every upper/lower-case spelling of those extensions, so matching is a single
+# str.endswith call without lowercasing each file name
+VIDEO_SUFFIXES = tuple(
+    "." + "".join(chars)
+    for extension in sorted(VIDEO_EXTENSIONS)
+    for chars in itertools.product(*({char.lower(), char.upper()} for char in extension))
+)
+
+def is_video_file(name):
+    """Return True if the file name has one of the VIDEO_EXTENSIONS (any case)"""
+    return name.endswith(VIDEO_SUFFIXES)
 
 def init_worker():
     """
@@ -219,55 +248,66 @@ def get_icon_preferences():
         "y_position": float(y_pos)
     }
 
+def _bar_visible(height_pixels, opacity):
+    """A drawbox bar only changes pixels with a positive height and opacity."""
+    return height_pixels > 0 and float(opacity) > 0
+
 def generate_filter_complex(input_path, brand_icon, target_dimensions, black_bg_params=None, 
                           video_position_params=None, top_bg_params=None, icon_params=None,
-                          text_overlays=None):
-    """Generate the filter_complex string with properly chained filters."""
+                          text_overlays=None, video_input="0:v", icon_input="1:v", label_suffix="",
+                          text_inputs=None):
+    """
+    Generate the filter_complex string with properly chained filters.
+
+    video_input/icon_input name the input streams and label_suffix is appended
+    to every intermediate label (the final one becomes [out<suffix>]), so that
+    several chains can share one FFmpeg command. text_inputs names the stream of
+    each pre-rendered text overlay PNG (see text_overlay_inputs); by default they
+    follow the icon as inputs 2, 3, ...
+    """
     target_width, target_height = target_dimensions
-    current_stage = "scaled"
+    current_stage = f"scaled{label_suffix}"
     
     # Initial scaling and positioning
     if video_position_params:
         # Calculate video and black bar heights
         bottom_height = int(target_height * (video_position_params["bottom_height_percent"] / 100))
         video_height = target_height - bottom_height
-        opacity = video_position_params["opacity"]
         
+        # Scale video to fit within the allocated space. The pad below it is
+        # the black background bar: every row from video_height down is pad,
+        # so a drawbox of black@opacity over it would not change a pixel and
+        # is left out of the graph
         filter_complex = (
-            # Scale video to fit within the allocated space
-            f"[0:v]scale={target_width}:{video_height}:force_original_aspect_ratio=decrease,"
-            f"pad={target_width}:{target_height}:(ow-iw)/2:0:black[scaled];"
-            
-            # Add black background at the bottom
-            f"[scaled]drawbox=x=0:y={video_height}:w={target_width}:h={bottom_height}:"
-            f"color=black@{opacity}:t=fill[withbg]"
+            f"[{video_input}]scale={target_width}:{video_height}:force_original_aspect_ratio=decrease,"
+            f"pad={target_width}:{target_height}:(ow-iw)/2:0:black[{current_stage}]"
         )
-        
-        current_stage = "withbg"
     else:
         filter_complex = (
-            f"[0:v]scale={target_width}:{target_height}:force_original_aspect_ratio=decrease,"
+            f"[{video_input}]scale={target_width}:{target_height}:force_original_aspect_ratio=decrease,"
             f"pad={target_width}:{target_height}:(ow-iw)/2:(oh-ih)/2:black[{current_stage}]"
         )
 
     # Add top black background if requested
     if top_bg_params:
         height_pixels = int(target_height * (top_bg_params["height_percent"] / 100))
-        filter_complex += (
-            f";[{current_stage}]drawbox=x=0:y=0:w={target_width}:h={height_pixels}:"
-            f"color=black@{top_bg_params['opacity']}:t=fill[top]"
-        )
-        current_stage = "top"
+        if _bar_visible(height_pixels, top_bg_params["opacity"]):
+            filter_complex += (
+                f";[{current_stage}]drawbox=x=0:y=0:w={target_width}:h={height_pixels}:"
+                f"color=black@{top_bg_params['opacity']}:t=fill[top{label_suffix}]"
+            )
+            current_stage = f"top{label_suffix}"
 
     # Add bottom black background if requested
     if black_bg_params:
         height_pixels = int(target_height * (black_bg_params["height_percent"] / 100))
-        y_position = target_height - height_pixels
-        filter_complex += (
-            f";[{current_stage}]drawbox=x=0:y={y_position}:w={target_width}:h={height_pixels}:"
-            f"color=black@{black_bg_params['opacity']}:t=fill[bg]"
-        )
-        current_stage = "bg"
+        if _bar_visible(height_pixels, black_bg_params["opacity"]):
+            y_position = target_height - height_pixels
+            filter_complex += (
+                f";[{current_stage}]drawbox=x=0:y={y_position}:w={target_width}:h={height_pixels}:"
+                f"color=black@{black_bg_params['opacity']}:t=fill[bg{label_suffix}]"
+            )
+            current_stage = f"bg{label_suffix}"
 
     # Process icon positioning
     icon_params = icon_params or {"width": 500, "x_position": "c", "y_position": 12.5}
@@ -293,58 +333,217 @@ def generate_filter_complex(input_path, brand_icon, target_dimensions, black_bg_
 
     # Add the brand icon overlay with proper output label
     filter_complex += (
-        f";[1:v]scale={icon_width}:-1[icon];"
-        f"[{current_stage}][icon]overlay={x_formula}:{y_formula}[withicon]"
+        f";[{icon_input}]scale={icon_width}:-1[icon{label_suffix}];"
+        f"[{current_stage}][icon{label_suffix}]overlay={x_formula}:{y_formula}[withicon{label_suffix}]"
     )
-    current_stage = "withicon"
+    current_stage = f"withicon{label_suffix}"
     
-    # Add text overlays if present
+    # Composite the pre-rendered text overlays; the PNGs include the background
+    # box and TEXT_OVERLAY_PADDING around the text
     if text_overlays:
         for idx, overlay in enumerate(text_overlays):
-            next_stage = f"text{idx}"
+            next_stage = f"text{idx}{label_suffix}"
+            text_input = text_inputs[idx] if text_inputs else f"{2 + idx}:v"
             
             # Calculate position
             if overlay['position'] == 'top':
-                y_pos = str(overlay['margin'])
+                y_pos = str(int(overlay['margin']) - TEXT_OVERLAY_PADDING)
             elif overlay['position'] == 'middle':
-                y_pos = "(h-th)/2"  # Use 'th' instead of 'text_h'
+                y_pos = "(main_h-overlay_h)/2"
             else:  # bottom
-                y_pos = f"h-th-{overlay['margin']}"  # Use 'th' instead of 'text_h'
+                offset = int(overlay['margin']) - TEXT_OVERLAY_PADDING
+                y_pos = f"main_h-overlay_h-{offset}" if offset >= 0 else f"main_h-overlay_h+{-offset}"
 
-            filter_complex += f";[{current_stage}]"
-            
-            # Add text first to calculate its dimensions
-            filter_complex += (
-                f"drawtext=text='{overlay['text']}':"
-                f"fontsize={overlay['font_size']}:"
-                f"fontcolor={overlay['color']}"
-            )
-            
-            if 'font' in overlay and overlay['font'].lower() != 'arial':
-                filter_complex += f":fontfile='{overlay['font']}'"
-            
-            # Add position calculations
             filter_complex += (
-                f":x=(w-tw)/2:"  # Use 'tw' instead of 'text_w'
-                f"y={y_pos}"
+                f";[{current_stage}][{text_input}]"
+                f"overlay=(main_w-overlay_w)/2:{y_pos}[{next_stage}]"
             )
-
-            # If background is enabled, add box
-            if overlay.get('bg_opacity', 0) > 0:
-                filter_complex += (
-                    f":box=1:"
-                    f"boxcolor={overlay['bg_color']}@{overlay['bg_opacity']}:"
-                    f"boxborderw=10"  # 10 pixels padding
-                )
-            
-            filter_complex += f"[{next_stage}]"
             current_stage = next_stage
 
     # Add final output label
-    filter_complex += f";[{current_stage}]copy[out]"
+    filter_complex += f";[{current_stage}]copy[out{label_suffix}]"
+
+    return filter_complex
+
+# Padding in pixels around pre-rendered text (the former drawtext boxborderw)
+TEXT_OVERLAY_PADDING = 10
+
+def _load_font(font, font_size):
+    """Load a TrueType font by name or path, falling back to Pillow's default font"""
+    for candidate in (font, f"{font}.ttf", "arial.ttf", "DejaVuSans.ttf"):
+        try:
+            return ImageFont.truetype(candidate, font_size)
+        except (OSError, TypeError):
+            continue
+    return ImageFont.load_default(size=font_size)
+
+def _overlay_rgb(color, default):
+    """Parse a color name, #RRGGBB or FFmpeg-style 0xRRGGBB into an RGB tuple"""
+    if isinstance(color, str) and color.lower().startswith("0x"):
+        color = "#" + color[2:]
+    try:
+        return ImageColor.getrgb(color)[:3]
+    except (ValueError, AttributeError):
+        return default
+
+def render_text_overlay_png(text, font, font_size, color, bg_color, bg_opacity):
+    """
+    Render a text overlay and its background box to an RGBA PNG, once per look.
+
+    FFmpeg composites the PNG with overlay instead of rasterising the text with
+    drawtext on every frame. Files are named by a hash of the arguments in a
+    shared temp directory, so worker processes reuse each other's renders; the
+    file is checked on every call, so a render removed by a temp cleaner is
+    simply drawn again.
+
+    Returns:
+        str: Path to the PNG.
+    """
+    key = repr((text, font, font_size, color, bg_color, bg_opacity)).encode('utf-8')
+    overlay_dir = os.path.join(tempfile.gettempdir(), "shorts_text_overlays")
+    png_path = os.path.join(overlay_dir, hashlib.sha1(key).hexdigest() + ".png")
+    if os.path.isfile(png_path):
+        return png_path
+    os.makedirs(overlay_dir, exist_ok=True)
+
+    pil_font = _load_font(font, font_size)
+    left, top, right, bottom = ImageDraw.Draw(Image.new("RGBA", (1, 1))).multiline_textbbox(
+        (0, 0), text, font=pil_font
+    )
+    padding = TEXT_OVERLAY_PADDING
+    image = Image.new("RGBA", (right - left + 2 * padding, bottom - top + 2 * padding), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    if bg_opacity > 0:
+        draw.rectangle(
+            [(0, 0), image.size],
+            fill=(*_overlay_rgb(bg_color, (0, 0, 0)), int(round(min(1.0, bg_opacity) * 255)))
+        )
+    draw.multiline_text(
+        (padding - left, padding - top), text, font=pil_font,
+        fill=(*_overlay_rgb(color, (255, 255, 255)), 255)
+    )
+
+    # Write to a temporary name first so a concurrent reader never sees a partial file
+    fd, tmp_path = tempfile.mkstemp(suffix=".png", dir=overlay_dir)
+    os.close(fd)
+    image.save(tmp_path, "PNG")
+    os.replace(tmp_path, png_path)
+    return png_path
+
+def text_overlay_inputs(text_overlays, first_index):
+    """
+    Render the text overlays and return the FFmpeg input arguments for them.
+
+    Parameters:
+        text_overlays (list): Overlay dicts as produced by the GUI, or None.
+        first_index (int): FFmpeg input index of the first overlay PNG.
+
+    Returns:
+        tuple: (list of "-i" arguments, tuple of stream labels for generate_filter_complex)
+    """
+    input_args = []
+    streams = []
+    for idx, overlay in enumerate(text_overlays or ()):
+        png_path = render_text_overlay_png(
+            overlay['text'], overlay.get('font', 'Arial'), int(overlay['font_size']),
+            overlay['color'], overlay.get('bg_color', 'black'), float(overlay.get('bg_opacity', 0))
+        )
+        input_args += ["-i", png_path]
+        streams.append(f"{first_index + idx}:v")
+    return input_args, tuple(streams)
+
+# NVENC options placed after "-c:v h264_nvenc"; NVENC_SETTINGS in config.yaml
+# overrides individual entries (null removes one)
+DEFAULT_NVENC_SETTINGS = {
+    "preset": "p6",
+    "tune": "hq",
+    "rc": "vbr",
+    "cq": 20,
+    "b_ref_mode": "middle",
+    "spatial-aq": 1,
+    "temporal-aq": 1,
+    "rc-lookahead": 20,
+}
+
+def get_encoder_args(config=None):
+    """Build the NVENC FFmpeg arguments, applying NVENC_SETTINGS from config"""
+    settings = dict(DEFAULT_NVENC_SETTINGS)
+    if config and config.get("NVENC_SETTINGS"):
+        settings.update(config["NVENC_SETTINGS"])
+    encoder_args = []
+    for option, value in settings.items():
+        if value is not None:
+            encoder_args += [f"-{option}", str(value)]
+    return encoder_args
+
+def max_parallel_jobs():
+    """Number of FFmpeg jobs to run at once: SHORTS_MAX_PARALLEL, else half the cores (at most 4)
+
+    The scale/pad/overlay filters run on the CPU, so a few jobs keep NVENC busy
+    without oversubscribing the cores; the variable also caps NVENC sessions.
+    """
+    default = min(4, max(1, (os.cpu_count() or 2) // 2))
+    return max(1, int(os.environ.get("SHORTS_MAX_PARALLEL", default)))
+
+def _freeze(value):
+    """Convert nested dicts/lists into hashable tuples for use as cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+_filter_complex_cache = {}
+
+def cached_filter_complex(target_dimensions, black_bg_params=None, video_position_params=None,
+                          top_bg_params=None, icon_params=None, text_overlays=None,
+                          video_input="0:v", icon_input="1:v", label_suffix="", text_inputs=None):
+    """
+    Return the filter_complex string for these parameters, building it only once.
 
+    The filter graph does not depend on the input or icon path, so every video
+    in a batch with the same settings shares one string.
+    """
+    key = _freeze((target_dimensions, black_bg_params, video_position_params,
+                   top_bg_params, icon_params, text_overlays,
+                   video_input, icon_input, label_suffix, text_inputs))
+    filter_complex = _filter_complex_cache.get(key)
+    if filter_complex is None:
+        filter_complex = generate_filter_complex(
+            None, None, target_dimensions, black_bg_params,
+            video_position_params, top_bg_params, icon_params, text_overlays,
+            video_input, icon_input, label_suffix, text_inputs
+        )
+        if len(_filter_complex_cache) >= 64:
+            _filter_complex_cache.clear()
+        _filter_complex_cache[key] = filter_complex
     return filter_complex
 
+def run_ffmpeg(command):
+    """Run an FFmpeg command, raising CalledProcessError with the tail of its log on failure."""
+    # Run FFmpeg, keeping only the tail of its log for error reporting
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,  # Enables text mode with universal newlines
+        encoding='utf-8',         # Specify UTF-8 encoding
+        errors='replace'          # Replace invalid characters instead of failing
+    )
+    
+    # Stream stderr instead of buffering FFmpeg's per-frame progress output
+    stderr_tail = deque(maxlen=200)
+    for line in process.stderr:
+        stderr_tail.append(line)
+    process.wait()
+    
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(
+            process.returncode, 
+            command, 
+            stderr=''.join(stderr_tail)
+        )
+
 def process_video(video_args):
     """
     Encodes a single video with FFmpeg using NVENC for hardware acceleration.
@@ -352,56 +551,42 @@ def process_video(video_args):
     Parameters:
         video_args (tuple): Contains input_path, brand_icon, output_path, target_dimensions,
                             black_bg_params, video_position_params, top_bg_params,
-                            icon_params, text_overlays.
+                            icon_params, text_overlays and optionally encoder_args
+                            (defaults to get_encoder_args()).
 
     Returns:
         str: Path to the processed video file.
     """
     input_path, brand_icon, output_path, target_dimensions, black_bg_params, \
-    video_position_params, top_bg_params, icon_params, text_overlays = video_args
+    video_position_params, top_bg_params, icon_params, text_overlays = video_args[:9]
+    encoder_args = video_args[9] if len(video_args) > 9 else get_encoder_args()
     
-    filter_complex = generate_filter_complex(
-        input_path, brand_icon, target_dimensions, black_bg_params,
-        video_position_params, top_bg_params, icon_params, text_overlays
+    # Text overlay PNGs follow the video (0) and the icon (1)
+    text_args, text_inputs = text_overlay_inputs(text_overlays, 2)
+    filter_complex = cached_filter_complex(
+        target_dimensions, black_bg_params,
+        video_position_params, top_bg_params, icon_params, text_overlays,
+        text_inputs=text_inputs
     )
 
     command = [
         "ffmpeg",
+        "-hwaccel", "cuda",   # Decode on the GPU (NVDEC); falls back to CPU if unavailable
         "-i", input_path,
         "-i", brand_icon,
+        *text_args,
         "-filter_complex", filter_complex,
         "-map", "[out]",      # Explicitly map the final output
         "-map", "0:a?",       # Map audio if present
         "-c:v", "h264_nvenc",
-        "-preset", "p4",
-        "-cq", "20",
+        *encoder_args,
         "-c:a", "copy",
         "-y",
         output_path
     ]
 
     try:
-        # Run FFmpeg and capture output for debugging
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,  # Enables text mode with universal newlines
-            encoding='utf-8',         # Specify UTF-8 encoding
-            errors='replace'          # Replace invalid characters instead of failing
-        )
-        
-        # Wait for the process to complete and get output
-        stdout, stderr = process.communicate()
-        
-        if process.returncode != 0:
-            raise subprocess.CalledProcessError(
-                process.returncode, 
-                command, 
-                output=stdout, 
-                stderr=stderr
-            )
-            
+        run_ffmpeg(command)
         return output_path
         
     except subprocess.CalledProcessError as e:
@@ -411,12 +596,130 @@ def process_video(video_args):
         print(f"[ERROR] Unexpected error processing {input_path}: {str(e)}")
         raise e
 
-def load_config():
-    """Load configuration from config.yaml"""
-    config_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
+def process_video_batch(batch_args):
+    """
+    Encodes several videos that share the same settings in one FFmpeg process.
+
+    Every input gets its own filter chain and output, so FFmpeg start-up and
+    NVENC initialisation are paid once per batch instead of once per video.
+    All outputs are encoded concurrently, so keep batches within the number of
+    NVENC sessions the GPU allows.
+
+    Parameters:
+        batch_args (tuple): Same layout as process_video's video_args, but with a list
+                            of input paths and a matching list of output paths.
+
+    If the batch fails, each video is retried on its own, so a single bad
+    input does not fail the others.
+
+    Returns:
+        list: Paths to the processed video files.
+    """
+    input_paths, brand_icon, output_paths, target_dimensions, black_bg_params, \
+    video_position_params, top_bg_params, icon_params, text_overlays = batch_args[:9]
+    encoder_args = batch_args[9] if len(batch_args) > 9 else get_encoder_args()
+
+    if len(input_paths) == 1:
+        return [process_video((input_paths[0], brand_icon, output_paths[0], *batch_args[3:9], encoder_args))]
+
+    icon_index = len(input_paths)
+    command = ["ffmpeg", "-y"]
+    for input_path in input_paths:
+        command += ["-hwaccel", "cuda", "-i", input_path]
+    command += ["-i", brand_icon]
+    text_args, text_inputs = text_overlay_inputs(text_overlays, icon_index + 1)
+    command += text_args
+
+    filter_complex = ";".join(
+        cached_filter_complex(
+            target_dimensions, black_bg_params,
+            video_position_params, top_bg_params, icon_params, text_overlays,
+            video_input=f"{idx}:v", icon_input=f"{icon_index}:v", label_suffix=f"_{idx}",
+            text_inputs=text_inputs
+        )
+        for idx in range(len(input_paths))
+    )
+    command += ["-filter_complex", filter_complex]
+
+    for idx, output_path in enumerate(output_paths):
+        command += [
+            "-map", f"[out_{idx}]",
+            "-map", f"{idx}:a?",
+            "-c:v", "h264_nvenc",
+            *encoder_args,
+            "-c:a", "copy",
+            output_path
+        ]
+
+    try:
+        run_ffmpeg(command)
+        return list(output_paths)
+
+    except subprocess.CalledProcessError as e:
+        # One bad input fails the whole FFmpeg process; encode the inputs one
+        # at a time so only that clip fails and the error names it
+        print(f"[WARNING] FFmpeg failed for batch starting with {input_paths[0]}, "
+              f"retrying its videos one at a time:\n{e.stderr}")
+        processed = []
+        first_error = None
+        for input_path, output_path in zip(input_paths, output_paths):
+            try:
+                processed.append(process_video((input_path, brand_icon, output_path, *batch_args[3:9], encoder_args)))
+            except Exception as retry_error:
+                first_error = first_error or retry_error
+        if first_error is not None:
+            raise first_error
+        return processed
+    except Exception as e:
+        print(f"[ERROR] Unexpected error processing batch starting with {input_paths[0]}: {str(e)}")
+        raise e
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.yaml')
+
+@functools.lru_cache(maxsize=8)
+def _cached_load_config(config_path, mtime, size):
+    """
+    Parse a config file; mtime and size are part of the cache key so edits are picked up.
+
+    The parsed config is also written to a "<config>.cache.json" sidecar along
+    with the YAML's mtime and size; later launches read it instead of the YAML
+    while both still match.
+    """
+    cache_path = config_path + ".cache.json"
+    source = [mtime, size]
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached["source"] == source:
+            return cached["config"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # Missing, stale or malformed sidecar: fall back to the YAML
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    try:
+        # Only cache configs that survive a JSON round trip unchanged
+        if json.loads(json.dumps(config)) == config:
+            # Write to a temporary name first so a concurrent reader never sees a partial file
+            fd, tmp_path = tempfile.mkstemp(suffix=".json", dir=os.path.dirname(cache_path))
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({"source": source, "config": config}, f)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+    except (OSError, TypeError, ValueError):
+        pass
+    return config
+
+def load_config(config_path=CONFIG_PATH):
+    """Load configuration from config.yaml, re-parsing only when the file changes"""
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        stat = os.stat(config_path)
+        # Callers may modify the config, so hand out a copy of the cached parse
+        return copy.deepcopy(_cached_load_config(config_path, stat.st_mtime_ns, stat.st_size))
     except FileNotFoundError:
         print("[WARNING] config.yaml not found, using hardcoded defaults")
         return None
@@ -583,13 +886,15 @@ def main():
         icon_params = get_icon_preferences()
 
     # Collect video files
+    encoder_args = get_encoder_args(config)
     video_paths = []
-    for video_file in os.listdir(source_folder):
-        if video_file.lower().endswith((".mp4", ".mov")):
-            input_path = os.path.join(source_folder, video_file)
-            output_path = os.path.join(output_folder, f"processed_{video_file}")
-            video_paths.append((input_path, brand_icon, output_path, target_dimensions,
-                              black_bg_params, video_position_params, top_bg_params, icon_params, None))  # Add text_overlays parameter
+    with os.scandir(source_folder) as entries:
+        video_entries = [entry for entry in entries if entry.is_file() and is_video_file(entry.name)]
+    for entry in video_entries:
+        output_path = os.path.join(output_folder, f"processed_{entry.name}")
+        video_paths.append((entry.path, brand_icon, output_path, target_dimensions,
+                          black_bg_params, video_position_params, top_bg_params, icon_params, None,  # Add text_overlays parameter
+                          encoder_args))
 
     if not video_paths:
         print("[INFO] No videos found in the source folder to process.")
@@ -598,7 +903,7 @@ def main():
     print(f"\n[INFO] Found {len(video_paths)} video(s) to process.\n")
 
     # Set up multiprocessing Pool with initializer to ignore SIGINT in workers
-    pool = Pool(processes=4, initializer=init_worker)  # Adjust 'processes' based on CPU cores
+    pool = Pool(processes=min(max_parallel_jobs(), len(video_paths)), initializer=init_worker)
 
     try:
         # Initialize tqdm progress bar
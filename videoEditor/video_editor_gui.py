@@ -1,14 +1,19 @@
 # video_editor_gui.py
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext, Y
+from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
-import yaml
+import json
+import re
+import functools
+from collections import OrderedDict
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import queue
 import logging
+import logging.handlers
 from datetime import datetime
-from video_automater11 import process_video, load_config, get_parameters_from_config, get_platform_defaults, generate_filter_complex
-from typing import Dict, Any, Tuple
+from video_automater11 import load_config, get_parameters_from_config, get_platform_defaults, get_encoder_args, max_parallel_jobs, process_video_batch, is_video_file
 import cv2
 from PIL import Image, ImageTk
 import random
@@ -16,8 +21,32 @@ import numpy as np
 import subprocess
 from tkinter import colorchooser
 
+# Resolved once; assets and the default output folder live next to this script
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BRAND_ICON = os.path.join(SCRIPT_DIR, "assets", "fullicon.png")
+# Remembers the last chosen folders between sessions
+GUI_STATE_PATH = os.path.join(SCRIPT_DIR, "gui_state.json")
+
+# Text that float() / int() accept, checked up front so half-typed entries
+# do not raise on every keystroke
+_FLOAT_RE = re.compile(r"\s*[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?\s*\Z")
+_INT_RE = re.compile(r"\s*[+-]?\d+\s*\Z")
+
+def _clamp01(value):
+    """Convert to float and clamp to the 0-1 range"""
+    value = float(value)
+    return 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+
+def _clamp100(value):
+    """Convert to float and clamp to the 0-100 range"""
+    value = float(value)
+    return 0.0 if value < 0.0 else 100.0 if value > 100.0 else value
+
 class CustomSettingsDialog:
-    def __init__(self, parent, preview_callback, session_settings=None):
+    # Typing bursts shorter than this render once
+    PREVIEW_DELAY_MS = 150
+
+    def __init__(self, parent, preview_callback, session_settings=None, on_close=None):
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Custom Settings")
         self.dialog.geometry("500x600")
@@ -42,67 +71,88 @@ class CustomSettingsDialog:
         self.icon_x_pos = tk.StringVar(value=session_settings.get('icon', {}).get('x_position', 'c') if session_settings else "c")
         self.icon_y_pos = tk.StringVar(value=str(session_settings.get('icon', {}).get('y_position', 90)) if session_settings else "90")
         
+        # (section, key, variable, conversion) for each entry of the settings dict
+        self._setting_fields = (
+            ('video_position', 'enabled', self.video_position, bool),
+            ('video_position', 'height', self.video_position_height, float),
+            ('video_position', 'opacity', self.video_position_opacity, _clamp01),
+            ('video_position', 'position', self.video_position_type, str),
+            ('video_position', 'scale', self.video_scale, lambda value: float(value) / 100.0),
+            ('top_bg', 'enabled', self.top_bg, bool),
+            ('top_bg', 'height', self.top_bg_height, float),
+            ('top_bg', 'opacity', self.top_bg_opacity, _clamp01),
+            ('bottom_bg', 'enabled', self.bottom_bg, bool),
+            ('bottom_bg', 'height', self.bottom_bg_height, float),
+            ('bottom_bg', 'opacity', self.bottom_bg_opacity, _clamp01),
+            ('icon', 'width', self.icon_width, int),
+            ('icon', 'x_position', self.icon_x_pos, str),
+            ('icon', 'y_position', self.icon_y_pos, _clamp100),
+        )
+        # (variable, pattern) for the typed numeric fields
+        self._numeric_fields = tuple(
+            (variable, _INT_RE if convert is int else _FLOAT_RE)
+            for _, _, variable, convert in self._setting_fields
+            if convert not in (bool, str)
+        )
+        
+        self._last_settings = None
+        self._last_settings_hash = None
+        self._pending_after = None  # Trailing preview scheduled while typing
+        self._quiet_until = 0.0
         self.create_widgets()
         self.result = None
         self.preview_callback = preview_callback
+        
+        # Modal without blocking the caller: on_close(result) runs when the dialog closes
+        self.on_close = on_close
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
+        self.dialog.grab_set()
 
     def create_widgets(self):
         notebook = ttk.Notebook(self.dialog)
         notebook.pack(expand=True, fill='both', padx=5, pady=5)
         
-        # Video Position Frame with updated controls
-        vp_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(vp_frame, text='Video Position')
-        
-        # Video positioning options
-        ttk.Label(vp_frame, text="Video Position:").pack()
-        ttk.Radiobutton(vp_frame, text="Center", value="center", 
-                       variable=self.video_position_type).pack()
-        ttk.Radiobutton(vp_frame, text="Top", value="top", 
-                       variable=self.video_position_type).pack()
-        ttk.Radiobutton(vp_frame, text="Bottom", value="bottom", 
-                       variable=self.video_position_type).pack()
-        
-        ttk.Label(vp_frame, text="Video Scale (50-100%):").pack()
-        ttk.Entry(vp_frame, textvariable=self.video_scale).pack()
-        
-        # Black background options
-        ttk.Separator(vp_frame, orient='horizontal').pack(fill='x', pady=10)
-        ttk.Label(vp_frame, text="Black Background:").pack()
-        ttk.Checkbutton(vp_frame, text="Enable Background", 
-                       variable=self.video_position).pack()
-        ttk.Label(vp_frame, text="Background Height (10-50%):").pack()
-        ttk.Entry(vp_frame, textvariable=self.video_position_height).pack()
-        ttk.Label(vp_frame, text="Background Opacity (0.0-1.0):").pack()
-        ttk.Entry(vp_frame, textvariable=self.video_position_opacity).pack()
-        
-        # Top Background Frame with updated labels
-        top_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(top_frame, text='Top Background')
-        ttk.Checkbutton(top_frame, text="Enable Top Background", variable=self.top_bg).pack()
-        ttk.Label(top_frame, text="Background Height (5-30%):").pack()
-        ttk.Entry(top_frame, textvariable=self.top_bg_height).pack()
-        ttk.Label(top_frame, text="Background Opacity (0.0-1.0):").pack()
-        ttk.Entry(top_frame, textvariable=self.top_bg_opacity).pack()
-        
-        # Bottom Background Frame with updated labels
-        bottom_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(bottom_frame, text='Bottom Background')
-        ttk.Checkbutton(bottom_frame, text="Enable Bottom Background", variable=self.bottom_bg).pack()
-        ttk.Label(bottom_frame, text="Background Height (5-30%):").pack()
-        ttk.Entry(bottom_frame, textvariable=self.bottom_bg_height).pack()
-        ttk.Label(bottom_frame, text="Background Opacity (0.0-1.0):").pack()
-        ttk.Entry(bottom_frame, textvariable=self.bottom_bg_opacity).pack()
-        
-        # Icon Settings Frame with updated labels
-        icon_frame = ttk.Frame(notebook, padding="10")
-        notebook.add(icon_frame, text='Icon Settings')
-        ttk.Label(icon_frame, text="Icon Width (100-1000px):").pack()
-        ttk.Entry(icon_frame, textvariable=self.icon_width).pack()
-        ttk.Label(icon_frame, text="X Position (c=center, l=left, r=right, 0-100):").pack()
-        ttk.Entry(icon_frame, textvariable=self.icon_x_pos).pack()
-        ttk.Label(icon_frame, text="Y Position (0-100%):").pack()
-        ttk.Entry(icon_frame, textvariable=self.icon_y_pos).pack()
+        # One row spec per widget: ('label', text), ('radio', text, value, var),
+        # ('check', text, var), ('field', label, var) or ('separator',)
+        tabs = (
+            ('Video Position', (
+                ('label', "Video Position:"),
+                ('radio', "Center", "center", self.video_position_type),
+                ('radio', "Top", "top", self.video_position_type),
+                ('radio', "Bottom", "bottom", self.video_position_type),
+                ('field', "Video Scale (50-100%):", self.video_scale),
+                ('separator',),
+                ('label', "Black Background:"),
+                ('check', "Enable Background", self.video_position),
+                ('field', "Background Height (10-50%):", self.video_position_height),
+                ('field', "Background Opacity (0.0-1.0):", self.video_position_opacity),
+            )),
+            ('Top Background', (
+                ('check', "Enable Top Background", self.top_bg),
+                ('field', "Background Height (5-30%):", self.top_bg_height),
+                ('field', "Background Opacity (0.0-1.0):", self.top_bg_opacity),
+            )),
+            ('Bottom Background', (
+                ('check', "Enable Bottom Background", self.bottom_bg),
+                ('field', "Background Height (5-30%):", self.bottom_bg_height),
+                ('field', "Background Opacity (0.0-1.0):", self.bottom_bg_opacity),
+            )),
+            ('Icon Settings', (
+                ('field', "Icon Width (100-1000px):", self.icon_width),
+                ('field', "X Position (c=center, l=left, r=right, 0-100):", self.icon_x_pos),
+                ('field', "Y Position (0-100%):", self.icon_y_pos),
+            )),
+        )
+        
+        # Tabs start empty and are filled the first time they are shown; the
+        # settings live in the Tk variables, so unbuilt tabs still report them
+        self._tab_rows = {}
+        for text, rows in tabs:
+            frame = ttk.Frame(notebook, padding="10")
+            notebook.add(frame, text=text)
+            self._tab_rows[str(frame)] = (frame, rows)
+        notebook.bind('<<NotebookTabChanged>>', lambda event: self._populate_tab(notebook))
+        self._populate_tab(notebook)
         
         # Buttons
         button_frame = ttk.Frame(self.dialog)
@@ -110,111 +160,260 @@ class CustomSettingsDialog:
         ttk.Button(button_frame, text="OK", command=self.ok).pack(side='right', padx=5)
         ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side='right')
         
-        # Add change callbacks to all settings
-        self.video_position.trace_add("write", self.on_setting_changed)
-        self.video_position_height.trace_add("write", self.on_setting_changed)
-        self.video_position_opacity.trace_add("write", self.on_setting_changed)
-        self.video_position_type.trace_add("write", self.on_setting_changed)
-        self.video_scale.trace_add("write", self.on_setting_changed)
-        self.top_bg.trace_add("write", self.on_setting_changed)
-        self.top_bg_height.trace_add("write", self.on_setting_changed)
-        self.top_bg_opacity.trace_add("write", self.on_setting_changed)
-        self.bottom_bg.trace_add("write", self.on_setting_changed)
-        self.bottom_bg_height.trace_add("write", self.on_setting_changed)
-        self.bottom_bg_opacity.trace_add("write", self.on_setting_changed)
-        self.icon_width.trace_add("write", self.on_setting_changed)
-        self.icon_x_pos.trace_add("write", self.on_setting_changed)
-        self.icon_y_pos.trace_add("write", self.on_setting_changed)
-
-    def on_setting_changed(self, *args):
+        # Entries report changes through one dialog-level binding (the Toplevel
+        # is in every child's bindtags); buttons use their command callbacks
+        self.dialog.bind('<KeyRelease>', self.on_setting_changed, add='+')
+        self.dialog.bind('<FocusOut>', self.on_setting_changed, add='+')
+
+    def _populate_tab(self, notebook):
+        """Build the selected tab's widgets on its first activation"""
+        entry = self._tab_rows.pop(notebook.select(), None)
+        if not entry:
+            return
+        frame, rows = entry
+        for kind, *args in rows:
+            if kind == 'label':
+                ttk.Label(frame, text=args[0]).pack()
+            elif kind == 'radio':
+                text, value, variable = args
+                ttk.Radiobutton(frame, text=text, value=value, variable=variable,
+                                command=self.on_setting_changed).pack()
+            elif kind == 'check':
+                text, variable = args
+                ttk.Checkbutton(frame, text=text, variable=variable,
+                                command=self.on_setting_changed).pack()
+            elif kind == 'field':
+                text, variable = args
+                ttk.Label(frame, text=text).pack()
+                ttk.Entry(frame, textvariable=variable).pack()
+            elif kind == 'separator':
+                ttk.Separator(frame, orient='horizontal').pack(fill='x', pady=10)
+
+    def _collect_settings(self):
+        """Build the settings dict from the dialog variables"""
+        settings = {}
+        for section, key, variable, convert in self._setting_fields:
+            settings.setdefault(section, {})[key] = convert(variable.get())
+        return settings
+
+    def _emit_settings(self):
+        """Send the current settings to the preview if they changed.
+
+        Returns False while a field does not parse yet.
+        """
+        if not all(pattern.match(variable.get()) for variable, pattern in self._numeric_fields):
+            return False
         try:
-            settings = {
-                'video_position': {
-                    'enabled': self.video_position.get(),
-                    'height': float(self.video_position_height.get()),
-                    'opacity': float(self.video_position_opacity.get()),
-                    'position': self.video_position_type.get(),
-                    'scale': float(self.video_scale.get()) / 100.0
-                },
-                'top_bg': {
-                    'enabled': self.top_bg.get(),
-                    'height': float(self.top_bg_height.get()),
-                    'opacity': float(self.top_bg_opacity.get())
-                },
-                'bottom_bg': {
-                    'enabled': self.bottom_bg.get(),
-                    'height': float(self.bottom_bg_height.get()),
-                    'opacity': float(self.bottom_bg_opacity.get())
-                },
-                'icon': {
-                    'width': int(self.icon_width.get()),
-                    'x_position': self.icon_x_pos.get(),
-                    'y_position': float(self.icon_y_pos.get())
-                }
-            }
-            self.preview_callback(settings)
+            settings = self._collect_settings()
         except (ValueError, TypeError):
-            pass  # Ignore invalid values during typing
+            return False
+        
+        # Tk reports events for unchanged values too; skip those
+        settings_hash = hash(repr(settings))
+        if settings_hash != self._last_settings_hash:
+            self._last_settings_hash = settings_hash
+            self._last_settings = settings
+            self.preview_callback(settings)
+        return True
+
+    def on_setting_changed(self, event=None):
+        """Preview a change: buttons and focus changes render at once, typing is debounced"""
+        if event is None or event.type != tk.EventType.KeyRelease:
+            self._cancel_pending_preview()
+            self._emit_settings()  # Invalid values are ignored during typing
+            return
+        
+        # Leading edge: the first keystroke after a pause renders immediately,
+        # later ones within PREVIEW_DELAY_MS collapse into one trailing render
+        now = time.monotonic()
+        if self._pending_after is None and now >= self._quiet_until:
+            self._emit_settings()
+        else:
+            self._cancel_pending_preview()
+            self._pending_after = self.dialog.after(self.PREVIEW_DELAY_MS, self._emit_pending_preview)
+        self._quiet_until = now + self.PREVIEW_DELAY_MS / 1000.0
+
+    def _emit_pending_preview(self):
+        self._pending_after = None
+        self._emit_settings()
+
+    def _cancel_pending_preview(self):
+        if self._pending_after is not None:
+            self.dialog.after_cancel(self._pending_after)
+            self._pending_after = None
 
     def ok(self):
-        self.result = {
-            'video_position': {
-                'enabled': self.video_position.get(),
-                'height': float(self.video_position_height.get()),
-                'opacity': float(self.video_position_opacity.get()),
-                'position': self.video_position_type.get(),
-                'scale': float(self.video_scale.get()) / 100.0
-            },
-            'top_bg': {
-                'enabled': self.top_bg.get(),
-                'height': float(self.top_bg_height.get()),
-                'opacity': float(self.top_bg_opacity.get())
-            },
-            'bottom_bg': {
-                'enabled': self.bottom_bg.get(),
-                'height': float(self.bottom_bg_height.get()),
-                'opacity': float(self.bottom_bg_opacity.get())
-            },
-            'icon': {
-                'width': int(self.icon_width.get()),
-                'x_position': self.icon_x_pos.get(),
-                'y_position': float(self.icon_y_pos.get())
-            }
-        }
-        self.dialog.destroy()
+        if not self._emit_settings():
+            messagebox.showerror("Error", "Please enter valid numbers for all settings.")
+            return
+        self.result = self._last_settings
+        self._close()
 
     def cancel(self):
+        self._close()
+
+    def _close(self):
+        self._cancel_pending_preview()
         self.dialog.destroy()
+        if self.on_close:
+            self.on_close(self.result)
 
 class PreviewPanel:
+    # (settings key, frame edge) for each black background bar; the video
+    # position bar sits at the bottom, matching generate_filter_complex
+    BACKGROUND_BARS = (
+        ('video_position', 'bottom'),
+        ('top_bg', 'top'),
+        ('bottom_bg', 'bottom'),
+    )
+    # Targets at most this many frames ahead are reached by grabbing
+    # forward instead of seeking back to a keyframe
+    MAX_GRAB_SKIP = 30
+    # Sampled frames are shrunk to fit this many times the display size:
+    # enough for zooming the video in the preview, and far smaller than 4K
+    # sources to keep cached and to resize on every placement change
+    FRAME_SAMPLE_ZOOM = 2
+
     def __init__(self, parent, settings_callback):
         self.frame = ttk.LabelFrame(parent, text="Preview", padding="5")
-        self.canvas = tk.Canvas(self.frame, width=400, height=600)
+        self.display_width = 400
+        self.display_height = 600
+        self.canvas = tk.Canvas(self.frame, width=self.display_width, height=self.display_height)
         self.canvas.pack(expand=True, fill='both')
         self.current_preview = None
         self.current_video = None
         self.settings_callback = settings_callback
         self.preview_image = None
+        self._photos = {}  # (width, height) -> PhotoImage, one per aspect ratio used
+        self._canvas_image_id = None
         self.original_frame = None
         self.current_settings = None
         self.current_dimensions = (1080, 1920)  # Default dimensions
+        self._frame_cache = OrderedDict()  # video path -> sampled RGB frames, LRU order
+        self._frame_cache_size = 8
+        self._frames_per_video = 3
+        self._resize_cache = {}  # (frame id, width, height, scale) -> resized frame
+        self._base_cache = OrderedDict()  # (frame id, canvas size, video size, offsets) -> letterboxed canvas, LRU order
+        self._icon_path = BRAND_ICON
+        self._icon = None  # Decoded BGRA icon
+        self._icon_mtime = None  # st_mtime_ns of the file self._icon was decoded from
+        self._icon_cache = {}  # (icon width, icon height) -> (premultiplied BGR, 255 - alpha)
+        self._text_sprite_cache = {}  # text style -> (premultiplied BGR, 255 - alpha, text size)
+        self.reload_icon()
+        
+        # Rendering runs on a worker thread; both queues hold only the newest item
+        self._loaded_video = None
+        self._last_render_hash = None
+        self._render_requests = queue.Queue(maxsize=1)
+        self._rendered_frames = queue.Queue(maxsize=1)
+        self._free_canvases = queue.SimpleQueue()  # Output buffers handed back once shown or dropped
+        # With a threaded Tcl the render thread wakes the Tk thread itself;
+        # otherwise finished frames are polled for
+        self._tcl_threaded = bool(parent.tk.call("info", "exists", "tcl_platform(threaded)"))
+        self.frame.bind("<<PreviewReady>>", lambda event: self._poll_rendered_frames())
+        self._render_thread = threading.Thread(target=self._render_loop, daemon=True)
+        self._render_thread.start()
+        if not self._tcl_threaded:
+            self._poll_rendered_frames()
 
     def extract_random_frame(self, video_path):
+        frames = self._frame_cache.get(video_path)
+        if frames is None:
+            frames = (self._read_random_frames(video_path, self._frames_per_video)
+                      or self._read_random_frames_ffmpeg(video_path, self._frames_per_video))
+            if not frames:
+                return None
+            self._frame_cache[video_path] = frames
+            if len(self._frame_cache) > self._frame_cache_size:
+                self._frame_cache.popitem(last=False)
+                # Those caches are keyed by frame id, which a freed frame may
+                # hand on to a new one; while frames stay cached they remain valid
+                self._resize_cache.clear()
+                self._base_cache.clear()
+        else:
+            self._frame_cache.move_to_end(video_path)
+            
+        self.original_frame = random.choice(frames)
+        return self.original_frame
+
+    def _read_random_frames(self, video_path, count):
+        """Read up to count random frames (RGB) in one capture session"""
         cap = cv2.VideoCapture(video_path)
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        if total_frames <= 0:
+        try:
+            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            if total_frames <= 0:
+                return []
+            # Seek in ascending order so the decoder only moves forward
+            frame_indices = sorted(random.sample(range(total_frames), min(count, total_frames)))
+            frames = []
+            position = 0
+            for frame_index in frame_indices:
+                gap = frame_index - position
+                if 0 <= gap <= self.MAX_GRAB_SKIP:
+                    # Short hops: grab() demuxes without converting frames
+                    for _ in range(gap):
+                        if not cap.grab():
+                            break
+                else:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+                if not cap.grab():
+                    break
+                position = frame_index + 1
+                ret, frame = cap.retrieve()
+                if ret:
+                    frame = self._shrink_sample(frame)
+                    # Convert in place; the buffer is fresh per read
+                    frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame))
+            return frames
+        finally:
             cap.release()
-            return None
-        random_frame = random.randint(0, total_frames-1)
-        cap.set(cv2.CAP_PROP_POS_FRAMES, random_frame)
-        ret, frame = cap.read()
-        cap.release()
-        if ret:
-            self.original_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            return self.original_frame
-        return None
-
-    def apply_settings_to_frame(self, frame, settings, dimensions):
+
+    def _read_random_frames_ffmpeg(self, video_path, count):
+        """Read up to count random frames (RGB) with FFmpeg, for files OpenCV cannot decode"""
+        try:
+            probe = subprocess.run(
+                ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+                 "-of", "default=noprint_wrappers=1:nokey=1", video_path],
+                capture_output=True, text=True, check=True
+            )
+            duration = float(probe.stdout.strip())
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            return []
+            
+        frames = []
+        for timestamp in sorted(random.uniform(0, duration * 0.95) for _ in range(count)):
+            # -ss before -i seeks to the nearest keyframe and decodes only up to
+            # the requested time; BMP keeps the piped image uncompressed
+            result = subprocess.run(
+                ["ffmpeg", "-v", "error", "-ss", f"{timestamp:.3f}", "-i", video_path,
+                 "-frames:v", "1", "-f", "image2pipe", "-c:v", "bmp", "-"],
+                capture_output=True
+            )
+            if result.returncode != 0 or not result.stdout:
+                continue
+            frame = cv2.imdecode(np.frombuffer(result.stdout, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if frame is not None:
+                frame = self._shrink_sample(frame)
+                frames.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame))
+        return frames
+
+    def _shrink_sample(self, frame):
+        """Downscale a decoded frame to the largest size the preview can show"""
+        height, width = frame.shape[:2]
+        limit = min(self.FRAME_SAMPLE_ZOOM * self.display_width / width,
+                    self.FRAME_SAMPLE_ZOOM * self.display_height / height)
+        if limit >= 1.0:
+            return frame
+        return cv2.resize(frame, (max(1, int(width * limit)), max(1, int(height * limit))),
+                          interpolation=cv2.INTER_AREA)
+
+    def apply_settings_to_frame(self, frame, settings, dimensions, render_scale=1.0):
+        """Composite the preview frame for target dimensions.
+
+        render_scale composes the result directly at a fraction of the target
+        size (e.g. the preview canvas size); pixel-valued settings such as icon
+        width, margins and font size are scaled with it.
+        """
         if frame is None:
             return None
             
@@ -239,6 +438,9 @@ class PreviewPanel:
             settings['text_overlays'] = []
             
         target_width, target_height = dimensions
+        if render_scale != 1.0:
+            target_width = max(1, int(target_width * render_scale))
+            target_height = max(1, int(target_height * render_scale))
         current_height, current_width = frame.shape[:2]
         
         # Default scaling without any position adjustments
@@ -246,26 +448,21 @@ class PreviewPanel:
         new_width = int(current_width * scale)
         new_height = int(current_height * scale)
         
-        # Resize frame
-        resized = cv2.resize(frame, (new_width, new_height))
-        
-        # Create canvas
-        canvas = np.zeros((target_height, target_width, 3), dtype=np.uint8)
-        
         # Always center by default unless explicitly positioned
         x_offset = (target_width - new_width) // 2
         y_offset = (target_height - new_height) // 2
+        scale_factor = 1.0
         
         # Only adjust position if video position is enabled and settings exist
         if settings and 'video_position' in settings and settings['video_position'].get('enabled', False):
             position = settings['video_position'].get('position', 'center')
             scale_factor = settings['video_position'].get('scale', 1.0)
             
-            # Recalculate size if scale is changed
+            # Recalculate size if scale is changed; fit and user scale are
+            # combined so the frame is resized (and rounded) only once
             if scale_factor != 1.0:
-                new_width = int(new_width * scale_factor)
-                new_height = int(new_height * scale_factor)
-                resized = cv2.resize(frame, (new_width, new_height))
+                new_width = max(1, int(current_width * scale * scale_factor))
+                new_height = max(1, int(current_height * scale * scale_factor))
                 x_offset = (target_width - new_width) // 2
             
             # Adjust vertical position
@@ -278,68 +475,87 @@ class PreviewPanel:
                     bg_height = int(target_height * (settings['video_position']['height'] / 100))
                     y_offset = target_height - new_height - bg_height
         
-        # Place video on canvas
-        canvas[y_offset:y_offset+new_height, x_offset:x_offset+new_width] = resized
+        # The letterboxed video only depends on the frame and its placement, so
+        # build it once and give overlays a fresh copy on every call
+        base_key = (id(frame), target_width, target_height, new_width, new_height, x_offset, y_offset)
+        base = self._base_cache.get(base_key)
+        if base is not None:
+            self._base_cache.move_to_end(base_key)
+        else:
+            # Resize frame once per (frame, dimensions, scale) and reuse it while
+            # only the vertical position changes
+            resize_key = (id(frame), target_width, target_height, scale_factor)
+            resized = self._resize_cache.get(resize_key)
+            if resized is None:
+                if len(self._resize_cache) >= 8:
+                    self._resize_cache.clear()
+                resized = cv2.resize(frame, (new_width, new_height),
+                                     interpolation=self._interpolation_for(frame, new_width, new_height))
+                self._resize_cache[resize_key] = resized
+            
+            # Place video on canvas: crop anything outside it, then pad the rest
+            # with black in a single pass
+            x0, y0 = max(0, x_offset), max(0, y_offset)
+            x1 = min(target_width, x_offset + new_width)
+            y1 = min(target_height, y_offset + new_height)
+            if x1 > x0 and y1 > y0:
+                visible = resized[y0-y_offset:y1-y_offset, x0-x_offset:x1-x_offset]
+                base = cv2.copyMakeBorder(visible, y0, target_height - y1, x0, target_width - x1,
+                                          cv2.BORDER_CONSTANT, value=(0, 0, 0))
+            else:
+                base = np.zeros((target_height, target_width, 3), dtype=np.uint8)
+            # Read-only: it may be handed out as is below and must not be recycled
+            base.flags.writeable = False
+            # Evict one at a time so typing a scale or offset does not also
+            # drop the bases of the other frames and ratios in use
+            self._base_cache[base_key] = base
+            if len(self._base_cache) > 8:
+                self._base_cache.popitem(last=False)
+            
+        # Worked out once here; it also tells whether anything needs drawing
+        bars = self._background_bars(settings, target_height)
+        
+        # Nothing to draw over the video, so the cached base is the result
+        if not (bars or self._icon_available or settings['text_overlays']):
+            return base
+            
+        # Composition stays on plain arrays: at display size the remaining
+        # work is a copy plus a few strip and ROI blends, which an OpenCL
+        # (cv2.UMat) upload and download per frame would cost more than
+        canvas = self._take_canvas(base.shape)
+        np.copyto(canvas, base)
         
         # Apply effects only if explicitly enabled
         if settings:
-            # Apply video position background
-            if settings['video_position']['enabled']:
-                height_percent = settings['video_position']['height']
-                opacity = settings['video_position']['opacity']
-                height_pixels = int(target_height * (height_percent / 100))
-                overlay = canvas.copy()
-                cv2.rectangle(overlay, (0, target_height-height_pixels), 
-                            (target_width, target_height), (0,0,0), -1)
-                canvas = cv2.addWeighted(overlay, opacity, canvas, 1-opacity, 0)
-            
-            # Apply top background
-            if settings['top_bg']['enabled']:
-                height_percent = settings['top_bg']['height']
-                opacity = settings['top_bg']['opacity']
-                height_pixels = int(target_height * (height_percent / 100))
-                overlay = canvas.copy()
-                cv2.rectangle(overlay, (0, 0), (target_width, height_pixels), 
-                            (0,0,0), -1)
-                canvas = cv2.addWeighted(overlay, opacity, canvas, 1-opacity, 0)
-            
-            # Apply bottom background
-            if settings['bottom_bg']['enabled']:
-                height_percent = settings['bottom_bg']['height']
-                opacity = settings['bottom_bg']['opacity']
-                height_pixels = int(target_height * (height_percent / 100))
-                overlay = canvas.copy()
-                cv2.rectangle(overlay, (0, target_height-height_pixels), 
-                            (target_width, target_height), (0,0,0), -1)
-                canvas = cv2.addWeighted(overlay, opacity, canvas, 1-opacity, 0)
+            if bars:
+                self._darken_bars(canvas, bars)
                 
             # Apply icon if available
-            if os.path.exists("assets/fullicon.png"):
+            if self._icon_available:
                 try:
                     # Read icon with alpha channel
-                    icon = cv2.imread("assets/fullicon.png", cv2.IMREAD_UNCHANGED)
-                    if icon is not None and icon.shape[2] == 4:  # Ensure alpha channel exists
+                    icon = self._load_icon()
+                    if icon is not None:
                         # Calculate icon dimensions
-                        icon_width = min(settings['icon']['width'], target_width)
+                        icon_width = max(1, min(int(settings['icon']['width'] * render_scale), target_width))
                         aspect_ratio = icon.shape[0] / icon.shape[1]
-                        icon_height = int(icon_width * aspect_ratio)
-                        
-                        # Ensure icon fits within frame
-                        if icon_height > target_height:
-                            icon_height = target_height
-                            icon_width = int(icon_height / aspect_ratio)
+                        icon_height = max(1, int(icon_width * aspect_ratio))
                             
-                        # Resize icon
-                        icon = cv2.resize(icon, (icon_width, icon_height))
+                        # Resized, premultiplied icon layers for these dimensions;
+                        # None when no pixel of the icon is visible at this size
+                        layers = self._get_icon_layers(icon, icon_width, icon_height)
+                        
+                    if icon is not None and layers is not None:
+                        premultiplied, inv_alpha, (crop_x, crop_y) = layers
                         
                         # Calculate position
                         x_pos = settings['icon']['x_position']
                         if x_pos == 'c':
                             x = (target_width - icon_width) // 2
                         elif x_pos == 'l':
-                            x = 10
+                            x = int(10 * render_scale)
                         elif x_pos == 'r':
-                            x = target_width - icon_width - 10
+                            x = target_width - icon_width - int(10 * render_scale)
                         else:
                             try:
                                 x_percentage = float(x_pos)
@@ -349,25 +565,9 @@ class PreviewPanel:
                                 
                         y = int(target_height * (settings['icon']['y_position'] / 100))
                         
-                        # Ensure coordinates are within bounds
-                        x = max(0, min(x, target_width - icon_width))
-                        y = max(0, min(y, target_height - icon_height))
-                        
-                        # Create mask from alpha channel
-                        alpha = icon[:, :, 3] / 255.0
-                        alpha = np.expand_dims(alpha, axis=-1)
-                        
-                        # Extract BGR channels
-                        icon_bgr = icon[:, :, :3]
-                        
-                        # Get region of interest
-                        roi = canvas[y:y+icon_height, x:x+icon_width]
-                        
-                        # Ensure shapes match
-                        if roi.shape[:2] == icon_bgr.shape[:2]:
-                            # Blend using alpha mask
-                            blended = (1 - alpha) * roi + alpha * icon_bgr
-                            canvas[y:y+icon_height, x:x+icon_width] = blended
+                        # Blend the visible part; like the FFmpeg overlay, an icon
+                        # that runs past the frame edge is clipped
+                        self._blend_layers(canvas, premultiplied, inv_alpha, x + crop_x, y + crop_y)
                         
                 except Exception as e:
                     print(f"Error applying icon: {str(e)}")
@@ -376,22 +576,28 @@ class PreviewPanel:
             if 'text_overlays' in settings and settings['text_overlays']:
                 for overlay in settings['text_overlays']:
                     font_face = cv2.FONT_HERSHEY_SIMPLEX
-                    font_scale = overlay['font_size'] / 24.0  # Scale based on default size 24
+                    font_scale = overlay['font_size'] / 24.0 * render_scale  # Scale based on default size 24
                     color = self._parse_color(overlay['color'])
                     bg_color = self._parse_color(overlay['bg_color'])
                     thickness = 2
-                    margin = overlay['margin']
+                    margin = int(overlay['margin'] * render_scale)
 
                     # Apply bold if enabled
                     if overlay.get('bold', False):
                         thickness = 3
 
+                    thickness = max(1, round(thickness * render_scale))
+
                     # Apply italic by adjusting the font face
                     if overlay.get('italic', False):
                         font_face = cv2.FONT_HERSHEY_COMPLEX_SMALL
 
-                    # Get text size
-                    text_size = cv2.getTextSize(overlay['text'], font_face, font_scale, thickness)[0]
+                    # Rasterized text and background box, cached per style
+                    padding = int(10 * render_scale)
+                    premultiplied, inv_alpha, text_size = self._get_text_sprite(
+                        overlay['text'], font_face, font_scale, thickness,
+                        color, bg_color, overlay.get('bg_opacity', 0), padding
+                    )
 
                     # Calculate position
                     if overlay['position'] == 'top':
@@ -403,26 +609,194 @@ class PreviewPanel:
 
                     x_pos = (target_width - text_size[0]) // 2  # Center horizontally
 
-                    # Draw background if opacity > 0
-                    if overlay.get('bg_opacity', 0) > 0:
-                        bg_overlay = canvas.copy()
-                        padding = 10
-                        cv2.rectangle(
-                            bg_overlay,
-                            (x_pos - padding, y_pos - text_size[1] - padding),
-                            (x_pos + text_size[0] + padding, y_pos + padding),
-                            bg_color,
-                            -1
-                        )
-                        canvas = cv2.addWeighted(bg_overlay, overlay['bg_opacity'], canvas, 1 - overlay['bg_opacity'], 0)
-
-                    # Draw text
-                    cv2.putText(canvas, overlay['text'], (x_pos, y_pos),
-                              font_face, font_scale, color, thickness, cv2.LINE_AA)
+                    # The sprite's origin is the top-left corner of the background box
+                    self._blend_layers(canvas, premultiplied, inv_alpha,
+                                       x_pos - padding, y_pos - text_size[1] - padding)
 
         return canvas
 
-    def _parse_color(self, color):
+    def _get_text_sprite(self, text, font_face, font_scale, thickness, color, bg_color, bg_opacity, padding):
+        """Return (premultiplied BGR, 255 - alpha, text size) for a text overlay.
+
+        The sprite holds the anti-aliased text over its optional background box,
+        so a preview frame only has to blend it like the icon.
+        """
+        key = (text, font_face, font_scale, thickness, color, bg_color, bg_opacity, padding)
+        sprite = self._text_sprite_cache.get(key)
+        if sprite is not None:
+            return sprite
+            
+        (text_width, text_height), baseline = cv2.getTextSize(text, font_face, font_scale, thickness)
+        box_height = text_height + 2 * padding
+        sprite_height = text_height + padding + max(padding, baseline + thickness) + 1
+        sprite_width = text_width + 2 * padding + 1
+        
+        # Text coverage from the anti-aliased rasterizer
+        text_mask = np.zeros((sprite_height, sprite_width), dtype=np.uint8)
+        cv2.putText(text_mask, text, (padding, text_height + padding),
+                    font_face, font_scale, 255, thickness, cv2.LINE_AA)
+        # float32 is plenty for 8-bit output and halves the temporaries of
+        # NumPy's float64 default; this runs on every new text while typing
+        text_alpha = text_mask.astype(np.float32)[:, :, None] * np.float32(1 / 255)
+        
+        # Background box, drawn under the text
+        bg_alpha = np.zeros_like(text_alpha)
+        bg_alpha[:box_height + 1] = _clamp01(bg_opacity)
+        
+        alpha = text_alpha + (1 - text_alpha) * bg_alpha
+        premultiplied = (text_alpha * np.array(color, dtype=np.float32)
+                         + (1 - text_alpha) * bg_alpha * np.array(bg_color, dtype=np.float32))
+        # convertScaleAbs rounds and saturates to uint8 in one pass; the
+        # inverse alpha is built on one channel and only then expanded to three
+        sprite = (
+            cv2.convertScaleAbs(premultiplied),
+            cv2.cvtColor(cv2.convertScaleAbs(1 - alpha[:, :, 0], alpha=255), cv2.COLOR_GRAY2BGR),
+            (text_width, text_height),
+        )
+        
+        if len(self._text_sprite_cache) >= 64:
+            self._text_sprite_cache.clear()
+        self._text_sprite_cache[key] = sprite
+        return sprite
+
+    def reload_icon(self):
+        """Re-check the brand icon on disk and drop everything cached from it"""
+        self._icon_available = os.path.exists(self._icon_path)
+        self._icon = None
+        self._icon_mtime = None
+        self._icon_cache.clear()
+
+    def set_icon(self, icon):
+        """Use an already decoded BGRA brand icon instead of reading it from disk"""
+        self._icon_cache.clear()
+        # Alpha channel is required for blending
+        self._icon_available = icon is not None and icon.ndim == 3 and icon.shape[2] == 4
+        self._icon = icon if self._icon_available else None
+        self._icon_mtime = self._icon_file_mtime()
+
+    def _icon_file_mtime(self):
+        """Modification time of the icon file, or None when it cannot be read"""
+        try:
+            return os.stat(self._icon_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def refresh_icon(self):
+        """Drop the decoded icon if the file changed since it was loaded; the next render decodes it again"""
+        # Checked here rather than on every render, which keeps the render path
+        # free of file system calls
+        mtime = self._icon_file_mtime()
+        if mtime != self._icon_mtime:
+            self._icon_available = mtime is not None
+            self._icon = None
+            self._icon_cache.clear()
+
+    def _load_icon(self):
+        """Return the decoded BGRA brand icon, decoding it only when there is none (see refresh_icon)"""
+        if self._icon is None:
+            self._icon_mtime = self._icon_file_mtime()
+            icon = cv2.imread(self._icon_path, cv2.IMREAD_UNCHANGED)
+            if icon is None or icon.ndim != 3 or icon.shape[2] != 4:
+                self._icon_available = False  # Alpha channel is required for blending
+                return None
+            self._icon = icon
+        return self._icon
+
+    def _get_icon_layers(self, icon, icon_width, icon_height):
+        """Return the (premultiplied BGR, 255 - alpha, (x, y) offset) uint8 layers for an icon size.
+
+        The layers are cropped to the icon's visible pixels, so transparent
+        margins are never blended; the offset places the crop in the icon.
+        Returns None when no pixel is visible at this size.
+        """
+        key = (icon_width, icon_height)
+        if key in self._icon_cache:
+            return self._icon_cache[key]
+        resized = cv2.resize(icon, (icon_width, icon_height),
+                             interpolation=self._interpolation_for(icon, icon_width, icon_height))
+        crop_x, crop_y, crop_width, crop_height = cv2.boundingRect(resized[:, :, 3])
+        if crop_width == 0 or crop_height == 0:
+            # Fully transparent: nothing to blend, and OpenCV rejects empty inputs
+            layers = None
+        else:
+            resized = resized[crop_y:crop_y + crop_height, crop_x:crop_x + crop_width]
+            alpha = cv2.cvtColor(resized[:, :, 3], cv2.COLOR_GRAY2BGR)
+            premultiplied = cv2.multiply(resized[:, :, :3], alpha, scale=1/255.0)
+            layers = (premultiplied, cv2.bitwise_not(alpha), (crop_x, crop_y))
+        # Typing a width visits many sizes; keep only a few
+        if len(self._icon_cache) >= 8:
+            self._icon_cache.clear()
+        self._icon_cache[key] = layers
+        return layers
+
+    @staticmethod
+    def _blend_layers(canvas, premultiplied, inv_alpha, x, y):
+        """Alpha-blend premultiplied layers onto canvas at (x, y), clipped to the canvas"""
+        height, width = premultiplied.shape[:2]
+        x0, y0 = max(0, x), max(0, y)
+        x1 = min(canvas.shape[1], x + width)
+        y1 = min(canvas.shape[0], y + height)
+        if x1 <= x0 or y1 <= y0:
+            return
+        
+        # Matching window inside the layers
+        layer = (slice(y0 - y, y1 - y), slice(x0 - x, x1 - x))
+        # Two integer passes written straight back into the canvas view, so
+        # no full-size temporaries are allocated
+        roi = canvas[y0:y1, x0:x1]
+        cv2.multiply(roi, inv_alpha[layer], dst=roi, scale=1/255.0)
+        cv2.add(roi, premultiplied[layer], dst=roi)
+
+    @staticmethod
+    def _interpolation_for(image, width, height):
+        """INTER_AREA when either axis shrinks (faster and no moire), INTER_LINEAR otherwise"""
+        if width < image.shape[1] or height < image.shape[0]:
+            return cv2.INTER_AREA
+        return cv2.INTER_LINEAR
+
+    @staticmethod
+    def _bar_factor(opacity):
+        """Row factor for a black bar: blending black at opacity scales by 1 - opacity"""
+        return _clamp01(1.0 - opacity)
+
+    @classmethod
+    def _background_bars(cls, settings, target_height):
+        """Return (start row, end row, factor) for each enabled bar that darkens something.
+
+        Background bars only darken whole rows, so they are kept as row ranges
+        and each distinct band is darkened once (see _darken_bars).
+        """
+        bars = []
+        for key, edge in cls.BACKGROUND_BARS:
+            bar = settings[key]
+            if not bar['enabled']:
+                continue
+            height_pixels = min(target_height, max(0, int(target_height * (bar['height'] / 100))))
+            factor = cls._bar_factor(bar['opacity'])
+            if height_pixels == 0 or factor >= 1.0:
+                continue  # Empty or fully transparent
+            rows = (0, height_pixels) if edge == 'top' else (target_height - height_pixels, target_height)
+            bars.append((*rows, factor))
+        return bars
+
+    @staticmethod
+    def _darken_bars(canvas, bars):
+        """Scale canvas rows in place for (start, end, factor) bars; overlaps multiply"""
+        boundaries = sorted({row for start, end, _ in bars for row in (start, end)})
+        for y0, y1 in zip(boundaries[:-1], boundaries[1:]):
+            factor = 1.0
+            for start, end, bar_factor in bars:
+                if start <= y0 and y1 <= end:
+                    factor *= bar_factor
+            if factor <= 0.0:
+                canvas[y0:y1] = 0  # Opaque bar
+            elif factor < 1.0:
+                strip = canvas[y0:y1]
+                cv2.convertScaleAbs(strip, dst=strip, alpha=factor)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _parse_color(color):
         """Convert any color format to BGR for OpenCV"""
         if not color:
             return (255, 255, 255)  # Default to white
@@ -468,7 +842,6 @@ class PreviewPanel:
     def update_preview(self, video_path=None, settings=None, dimensions=None):
         if video_path and video_path != self.current_video:
             self.current_video = video_path
-            self.extract_random_frame(video_path)
             
         if settings:
             self.current_settings = settings
@@ -476,44 +849,135 @@ class PreviewPanel:
         if dimensions:
             self.current_dimensions = dimensions
             
-        if self.original_frame is not None:
-            frame = self.apply_settings_to_frame(
-                self.original_frame.copy(),
-                self.current_settings,
-                self.current_dimensions
-            )
+        # Nothing to do if this exact state was already sent for rendering
+        render_hash = hash((repr(self.current_settings), self.current_dimensions, self.current_video))
+        if render_hash == self._last_render_hash:
+            return
+        self._last_render_hash = render_hash
             
-            if frame is not None:
-                # Resize for display
-                display_height = 600
-                display_width = 400
-                scale = min(display_width/frame.shape[1], display_height/frame.shape[0])
-                display_size = (int(frame.shape[1]*scale), int(frame.shape[0]*scale))
-                frame = cv2.resize(frame, display_size)
-                
-                # Convert to PhotoImage
-                image = Image.fromarray(frame)
-                self.preview_image = ImageTk.PhotoImage(image)
-                
-                # Update canvas
-                self.canvas.delete("all")
-                self.canvas.create_image(
-                    display_width//2, 
-                    display_height//2, 
-                    anchor='center', 
-                    image=self.preview_image
+        # Hand the latest state to the render thread, replacing any request
+        # it has not started yet
+        settings_snapshot = dict(self.current_settings) if self.current_settings else None
+        self._put_latest(self._render_requests,
+                         (self.current_video, settings_snapshot, self.current_dimensions))
+
+    @staticmethod
+    def _put_latest(slot, item):
+        """Put item into a single-slot queue; return the pending item it replaced, if any"""
+        try:
+            dropped = slot.get_nowait()
+        except queue.Empty:
+            dropped = None
+        slot.put_nowait(item)
+        return dropped
+
+    def _recycle_canvas(self, canvas):
+        """Hand an output buffer back for reuse; cached read-only bases are skipped"""
+        if canvas.flags.writeable:
+            self._free_canvases.put(canvas)
+
+    def _take_canvas(self, shape):
+        """Return a recycled output buffer of shape, or a new one"""
+        while True:
+            try:
+                canvas = self._free_canvases.get_nowait()
+            except queue.Empty:
+                return np.empty(shape, dtype=np.uint8)
+            if canvas.shape == shape:
+                return canvas
+            # Buffers for an old size are simply dropped
+
+    def _render_loop(self):
+        """Render preview requests in the background thread"""
+        while True:
+            video_path, settings, dimensions = self._render_requests.get()
+            try:
+                if video_path and video_path != self._loaded_video:
+                    self._loaded_video = video_path
+                    self.extract_random_frame(video_path)
+                    
+                if self.original_frame is None:
+                    continue
+                    
+                # Compose directly at display size rather than downscaling
+                # a full-resolution frame afterwards
+                target_width, target_height = dimensions
+                scale = min(self.display_width/target_width, self.display_height/target_height)
+                frame = self.apply_settings_to_frame(
+                    self.original_frame,
+                    settings,
+                    dimensions,
+                    render_scale=scale
                 )
+                
+                if frame is not None:
+                    dropped = self._put_latest(self._rendered_frames, frame)
+                    if dropped is not None:
+                        self._recycle_canvas(dropped)
+                    # Wake the Tk thread for every frame: the wakeup for a dropped
+                    # frame may already have run and found the slot empty, and a
+                    # spare wakeup only finds nothing to show
+                    if self._tcl_threaded:
+                        self.frame.event_generate("<<PreviewReady>>", when="tail")
+            except Exception as e:
+                print(f"Error rendering preview: {str(e)}")
+
+    def _poll_rendered_frames(self):
+        """Show the newest rendered frame; Tk objects are only touched on the Tk thread"""
+        try:
+            frame = self._rendered_frames.get_nowait()
+            self._show_frame(frame)
+            # The photo holds its own copy, so the buffer can be rendered into again
+            self._recycle_canvas(frame)
+        except queue.Empty:
+            pass
+        finally:
+            if not self._tcl_threaded:
+                self.frame.after(50, self._poll_rendered_frames)
+
+    def _show_frame(self, frame):
+        # Pillow copies RGB data into its own image here (it can only map
+        # 4-byte and single-channel buffers), and paste() copies it into Tk
+        image = Image.fromarray(frame)
+        
+        # Paste into the existing PhotoImage when the size is unchanged; one
+        # photo is kept per size, so switching aspect ratios back and forth
+        # reuses them instead of creating a new one each time
+        if self.preview_image is not None and (self.preview_image.width(), self.preview_image.height()) == image.size:
+            self.preview_image.paste(image)
+            return
+            
+        photo = self._photos.get(image.size)
+        if photo is None:
+            # Custom dimensions can visit many sizes; keep only a few
+            if len(self._photos) >= 8:
+                self._photos.clear()
+            photo = self._photos[image.size] = ImageTk.PhotoImage(image)
+        else:
+            photo.paste(image)
+        self.preview_image = photo
+        if self._canvas_image_id is None:
+            self._canvas_image_id = self.canvas.create_image(
+                self.display_width//2, 
+                self.display_height//2, 
+                anchor='center', 
+                image=self.preview_image
+            )
+        else:
+            self.canvas.itemconfig(self._canvas_image_id, image=self.preview_image)
 
     def get_current_settings(self):
         """Return the current settings being used in the preview"""
         return self.current_settings
 
 class TextOverlayDialog:
-    def __init__(self, parent, callback, preview_callback=None):
+    def __init__(self, parent, callback, preview_callback=None, on_close=None):
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Text Overlays")
         self.dialog.geometry("600x400")
+        self.dialog.transient(parent)
         self.callback = callback
+        self.on_close = on_close  # Called with the overlays when the dialog closes
         self.preview_callback = preview_callback  # Add preview callback
         self.overlays = []
         self.dragging = False
@@ -523,6 +987,8 @@ class TextOverlayDialog:
         self.current_index = None  # Add this line
         self.drag_line_index = None  # Add this line to track the arrow position
         self.parent = parent  # Add this line to store parent reference
+        self.dialog.protocol("WM_DELETE_WINDOW", self.ok)
+        self.dialog.grab_set()
 
     def create_widgets(self):
         # Text overlays list
@@ -645,11 +1111,14 @@ class TextOverlayDialog:
             self.overlay_list.insert(tk.END, f"{idx + 1}. {overlay['text']} ({overlay['position']})")
 
     def add_overlay(self):
-        dialog = TextOverlaySettingsDialog(self.dialog, 
-                                         preview_callback=self.on_preview_update)
-        self.dialog.wait_window(dialog.dialog)
-        if dialog.result:
-            self.overlays.append(dialog.result)
+        TextOverlaySettingsDialog(self.dialog, 
+                                  preview_callback=self.on_preview_update,
+                                  on_close=self.on_overlay_added)
+
+    def on_overlay_added(self, result):
+        self.dialog.grab_set()  # Take the grab back from the closed child dialog
+        if result:
+            self.overlays.append(result)
             self.update_list()
             self.callback(self.overlays)
 
@@ -657,14 +1126,17 @@ class TextOverlayDialog:
         sel = self.overlay_list.curselection()
         if sel and sel[0] < len(self.overlays):  # Add bounds check
             idx = sel[0]
-            dialog = TextOverlaySettingsDialog(self.dialog, 
-                                             self.overlays[idx],
-                                             preview_callback=self.on_preview_update)
-            self.dialog.wait_window(dialog.dialog)
-            if dialog.result:
-                self.overlays[idx] = dialog.result
-                self.update_list()
-                self.callback(self.overlays)
+            TextOverlaySettingsDialog(self.dialog, 
+                                      self.overlays[idx],
+                                      preview_callback=self.on_preview_update,
+                                      on_close=lambda result: self.on_overlay_edited(idx, result))
+
+    def on_overlay_edited(self, idx, result):
+        self.dialog.grab_set()  # Take the grab back from the closed child dialog
+        if result and idx < len(self.overlays):
+            self.overlays[idx] = result
+            self.update_list()
+            self.callback(self.overlays)
 
     def remove_overlay(self):
         sel = self.overlay_list.curselection()
@@ -681,6 +1153,8 @@ class TextOverlayDialog:
 
     def ok(self):
         self.dialog.destroy()
+        if self.on_close:
+            self.on_close(self.overlays)
 
     def on_preview_update(self, current_settings):
         """Handle preview updates during text overlay editing"""
@@ -756,17 +1230,24 @@ class ColorPickerDialog:
         return (255, 255, 255)  # Default to white
 
 class TextOverlaySettingsDialog:
-    def __init__(self, parent, settings=None, preview_callback=None):
+    def __init__(self, parent, settings=None, preview_callback=None, on_close=None):
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Text Overlay Settings")
         self.dialog.geometry("400x500")
+        self.dialog.transient(parent)
         self.result = None
         self.preview_callback = preview_callback
+        self.on_close = on_close  # Called with the result when the dialog closes
         self.available_fonts = self.get_system_fonts()
+        self._last_preview_key = None  # Settings last sent to preview_callback
+        self._pending_after = None  # Trailing preview scheduled while typing
+        self._quiet_until = 0.0
         self.widgets_ready = False  # Add this flag
         self.create_widgets(settings)
         self.widgets_ready = True  # Set flag after widgets are created
         self.update_color_previews()  # Move this here
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
+        self.dialog.grab_set()
 
     def get_system_fonts(self):
         """Get list of available system fonts using cv2"""
@@ -790,8 +1271,6 @@ class TextOverlaySettingsDialog:
         self.text.pack(fill='x', padx=5)
         if settings.get('text'):
             self.text.insert('1.0', settings['text'])
-        # Add binding for text changes
-        self.text.bind('<KeyRelease>', self.on_setting_changed)
 
         # Font settings frame
         font_frame = ttk.LabelFrame(self.dialog, text="Font Settings", padding="5")
@@ -892,14 +1371,10 @@ class TextOverlaySettingsDialog:
         ttk.Button(btn_frame, text="OK", command=self.ok).pack(side='right', padx=5)
         ttk.Button(btn_frame, text="Cancel", command=self.cancel).pack(side='right')
 
-        # Add change event bindings to all inputs
-        self.font.bind('<<ComboboxSelected>>', self.on_setting_changed)
-        self.font_size.bind('<KeyRelease>', self.on_setting_changed)
-        self.color.bind('<KeyRelease>', self.on_setting_changed)
-        self.bg_color.bind('<KeyRelease>', self.on_setting_changed)
-        self.bg_opacity.bind('<KeyRelease>', self.on_setting_changed)
-        self.position.bind('<<ComboboxSelected>>', self.on_setting_changed)
-        self.margin.bind('<KeyRelease>', self.on_setting_changed)
+        # Typing and combobox picks in any input reach one dialog-level
+        # binding, as in CustomSettingsDialog; unchanged settings are skipped
+        self.dialog.bind('<KeyRelease>', self.on_setting_changed, add='+')
+        self.dialog.bind('<<ComboboxSelected>>', self.on_setting_changed, add='+')
         
         # Add trace to boolean variables
         self.bold.trace_add("write", self.on_bool_changed)
@@ -964,31 +1439,67 @@ class TextOverlaySettingsDialog:
                 'font_size': int(self.font_size.get()),
                 'color': self.color.get(),
                 'bg_color': self.bg_color.get(),
-                'bg_opacity': float(self.bg_opacity.get()),
+                'bg_opacity': _clamp01(self.bg_opacity.get()),
                 'position': self.position.get(),
                 'margin': int(self.margin.get()),
                 'bold': self.bold.get(),
                 'italic': self.italic.get()
             }
-            self.dialog.destroy()
         except ValueError as e:
             messagebox.showerror("Error", "Please enter valid numbers for font size, opacity, and margin.")
+            return
+        self._close()
 
     def cancel(self):
+        self._close()
+
+    def _close(self):
+        self._cancel_pending_preview()
         self.dialog.destroy()
+        if self.on_close:
+            self.on_close(self.result)
 
     def on_bool_changed(self, *args):
         """Handle changes in boolean variables"""
         self.on_setting_changed(None)
 
     def on_setting_changed(self, event):
-        """Update preview when any setting changes"""
+        """Update preview when any setting changes; typing is debounced like CustomSettingsDialog"""
         if not self.widgets_ready:  # Check if widgets are ready
             return
+        if event is None or event.type != tk.EventType.KeyRelease:
+            self._cancel_pending_preview()
+            self._emit_settings()
+            return
+        
+        delay_ms = CustomSettingsDialog.PREVIEW_DELAY_MS
+        now = time.monotonic()
+        if self._pending_after is None and now >= self._quiet_until:
+            self._emit_settings()
+        else:
+            self._cancel_pending_preview()
+            self._pending_after = self.dialog.after(delay_ms, self._emit_pending_preview)
+        self._quiet_until = now + delay_ms / 1000.0
+
+    def _emit_pending_preview(self):
+        self._pending_after = None
+        self._emit_settings()
+
+    def _cancel_pending_preview(self):
+        if self._pending_after is not None:
+            self.dialog.after_cancel(self._pending_after)
+            self._pending_after = None
+
+    def _emit_settings(self):
+        """Send the current settings to preview_callback if they changed"""
         try:
             current_settings = self.get_current_settings()
             if current_settings and self.preview_callback:
-                self.preview_callback(current_settings)
+                # Focus changes and re-typed values fire without changing anything
+                preview_key = tuple(sorted(current_settings.items()))
+                if preview_key != self._last_preview_key:
+                    self._last_preview_key = preview_key
+                    self.preview_callback(current_settings)
         except ValueError:
             pass  # Ignore invalid values during typing
 
@@ -1001,7 +1512,7 @@ class TextOverlaySettingsDialog:
                 'font_size': int(self.font_size.get()),
                 'color': self.color.get(),
                 'bg_color': self.bg_color.get(),
-                'bg_opacity': float(self.bg_opacity.get()),
+                'bg_opacity': _clamp01(self.bg_opacity.get()),
                 'position': self.position.get(),
                 'margin': int(self.margin.get()),
                 'bold': self.bold.get(),
@@ -1011,6 +1522,24 @@ class TextOverlaySettingsDialog:
             return None
 
 class VideoEditorGUI:
+    # Output dimensions per aspect ratio choice; custom ("4") uses current_dimensions
+    RATIO_DIMENSIONS = {
+        "1": (1080, 1080),
+        "2": (1080, 1920),
+        "3": (1920, 1080),
+    }
+
+    # Folders with more videos than this are not auto-previewed after browsing
+    AUTO_PREVIEW_MAX_VIDEOS = 50
+
+    # Lines kept in the log display; older ones are dropped in chunks of
+    # LOG_TRIM_LINES so a full log is not trimmed on every update
+    LOG_MAX_LINES = 5000
+    LOG_TRIM_LINES = 500
+
+    # Updates applied per check_queue call; the rest wait for the next one
+    QUEUE_DRAIN_MAX = 200
+
     def __init__(self, root):
         self.root = root
         self.root.title("Video Editor")
@@ -1031,31 +1560,56 @@ class VideoEditorGUI:
         self.selected_videos = set()  # Track selected videos
         self.current_preview_video = None  # Add this line
         self.text_overlays = []  # Add this line
+        self._preview_after_id = None  # Pending debounced preview update
+        self._pending_preview = {}
+        self._param_cache = {}  # platform -> parameters derived from self.config
+        self.gui_state = self.load_gui_state()
+        self.auto_preview = tk.BooleanVar(value=True)  # Preview the first video after browsing
         
         # Initialize current dimensions based on default aspect ratio
-        ratio_dimensions = {
-            "1": (1080, 1080),
-            "2": (1080, 1920),
-            "3": (1920, 1080),
-            "4": (1080, 1920)
-        }
-        self.current_dimensions = ratio_dimensions[self.aspect_ratio.get()]
+        self.current_dimensions = self.RATIO_DIMENSIONS.get(self.aspect_ratio.get(), (1080, 1920))
         
         # Load config
         self.config = load_config()
+        # The config is loaded once, so its encoder arguments never change
+        self.encoder_args = get_encoder_args(self.config)
+        
+        self.brand_icon = BRAND_ICON
         
         self.create_gui()
         
-        # Add queue for thread-safe updates
+        # Add queue for thread-safe updates; workers wake check_queue with a
+        # virtual event instead of the main loop polling the queue
         self.update_queue = queue.Queue()
+        self._wakeup_pending = False
+        self._closing = False  # Set once the window starts closing; post_update then leaves Tk alone
+        self._batch_futures = ()  # Batches of the running process_videos job, cancelled on close
+        self.root.bind("<<UpdateQueue>>", lambda event: self.check_queue())
+        
+        # One long-lived processing thread runs the jobs queued by the process buttons
+        self._jobs = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+        
+        # Without a threaded Tcl, worker threads cannot call into Tk, so fall
+        # back to polling every GUI_POLL_MS milliseconds
+        self.tcl_threaded = bool(self.root.tk.call("info", "exists", "tcl_platform(threaded)"))
+        self.poll_ms = int((self.config or {}).get("GUI_POLL_MS", 15))
+        if not self.tcl_threaded:
+            # Start polling once the main loop is running
+            self.root.after_idle(self.check_queue)
         
         # Set up logging
         self.setup_logging()
         
-        # Setup periodic queue check
-        self.check_queue()
+        # Decode the brand icon once, on the processing thread so the window
+        # is not held up; check_queue reports a missing icon, and the preview
+        # reuses the decoded image. Queued once the main loop runs, since the
+        # result is posted back through it
+        self.root.after_idle(self._jobs.put, self._check_brand_icon)
         
         self.aspect_ratio.trace_add("write", self.on_aspect_ratio_changed)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def setup_logging(self):
         log_dir = "logs"
@@ -1071,16 +1625,83 @@ class VideoEditorGUI:
         file_handler.setLevel(logging.INFO)
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
         
         # Stream handler with UTF-8 encoding
         stream_handler = logging.StreamHandler()
         stream_handler.setLevel(logging.INFO)
         stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
+        
+        # Log calls only enqueue records; a listener thread does the file and
+        # stream I/O so the processing thread never blocks on it
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler,
+                                                           respect_handler_level=True)
+        self.log_listener.start()
         
         self.logger = logger
 
+    def on_close(self):
+        """Stop the processing thread and flush pending log records before the window closes"""
+        if self.processing and not messagebox.askyesno(
+                "Processing", "Videos are still being processed.\n"
+                "Quit anyway? Videos already being encoded will finish, the rest are skipped."):
+            return
+        # The worker may still be running a batch; from here on its updates
+        # are only queued, never sent to the destroyed Tk root
+        self._closing = True
+        # Batches not yet started are dropped; running FFmpeg processes finish
+        # before the interpreter exits
+        for future in list(self._batch_futures):
+            future.cancel()
+        self._jobs.put(None)
+        self.log_listener.stop()
+        self.root.destroy()
+
+    def _worker_loop(self):
+        """Run queued jobs until a None sentinel arrives.
+
+        A job is either a keyword dict for process_videos or a callable.
+        """
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            # An uncaught error would end the only processing thread, leaving
+            # later jobs queued forever; log it and move on to the next job
+            try:
+                if callable(job):
+                    job()
+                else:
+                    self.process_videos(**job)
+            except Exception as e:
+                self.logger.exception("Processing job failed")
+                self.post_update("log", f"Error: {str(e)}")
+                if not callable(job):
+                    # Re-enable the process buttons
+                    self.post_update("complete", None)
+
+    def _check_brand_icon(self):
+        """Decode the brand icon (processing thread) and hand the result to check_queue"""
+        icon = None
+        try:
+            with open(self.brand_icon, 'rb') as f:
+                icon = cv2.imdecode(np.frombuffer(f.read(), np.uint8), cv2.IMREAD_UNCHANGED)
+        except (OSError, cv2.error):
+            # An empty or corrupt file makes imdecode raise; report it as unreadable
+            icon = None
+        self.post_update("icon", icon)
+
+    def _apply_brand_icon(self, icon):
+        """Disable processing when the brand icon could not be read; otherwise share it with the preview"""
+        if icon is None:
+            self.logger.warning(f"Brand icon missing or unreadable at '{self.brand_icon}'")
+            messagebox.showwarning("Warning", f"Brand icon missing or unreadable at '{self.brand_icon}'.\nVideo processing is disabled.")
+            self.process_button.config(state=tk.DISABLED)
+            self.process_selected_button.config(state=tk.DISABLED)
+        else:
+            self.preview_panel.set_icon(icon)
+
     def create_gui(self):
         # Main container with two columns
         main_frame = ttk.Frame(self.root, padding="10")
@@ -1113,7 +1734,7 @@ class VideoEditorGUI:
         list_frame.pack(fill='both', expand=True)
         
         scrollbar = ttk.Scrollbar(list_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=Y)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         self.video_listbox = tk.Listbox(list_frame, selectmode=tk.MULTIPLE, height=6, 
                                        yscrollcommand=scrollbar.set)
@@ -1137,6 +1758,8 @@ class VideoEditorGUI:
                   command=self.deselect_all_videos).pack(side=tk.LEFT, padx=2)
         ttk.Button(left_buttons, text="Remove Selected", 
                   command=self.remove_selected_videos).pack(side=tk.LEFT, padx=2)
+        ttk.Checkbutton(left_buttons, text="Auto-preview", 
+                       variable=self.auto_preview).pack(side=tk.LEFT, padx=2)
         
         # Right side buttons
         right_buttons = ttk.Frame(video_controls)
@@ -1210,8 +1833,9 @@ class VideoEditorGUI:
         self.process_button.grid(row=11, column=0, columnspan=3, pady=10)
         
         # Process selected video button
-        ttk.Button(controls_frame, text="Process Selected Video", 
-                  command=self.process_selected_video).grid(row=12, column=1, pady=10)
+        self.process_selected_button = ttk.Button(controls_frame, text="Process Selected Video", 
+                                                command=self.process_selected_video)
+        self.process_selected_button.grid(row=12, column=1, pady=10)
 
         # Add log display
         log_frame = ttk.LabelFrame(controls_frame, text="Logs", padding="5")
@@ -1220,13 +1844,38 @@ class VideoEditorGUI:
         self.log_display = scrolledtext.ScrolledText(log_frame, height=10, width=60, state='disabled')
         self.log_display.pack(expand=True, fill='both')
 
+    def load_gui_state(self):
+        """Read the remembered folders; a missing or broken state file is ignored"""
+        try:
+            with open(GUI_STATE_PATH, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _ask_folder(self, state_key, title):
+        """Pick a folder, starting from (and then remembering) the last choice for state_key"""
+        initialdir = self.gui_state.get(state_key)
+        if not initialdir or not os.path.isdir(initialdir):
+            initialdir = os.path.expanduser("~")
+        folder = filedialog.askdirectory(parent=self.root, title=title, mustexist=True,
+                                         initialdir=initialdir)
+        if folder:
+            self.gui_state[state_key] = folder
+            try:
+                with open(GUI_STATE_PATH, 'w', encoding='utf-8') as f:
+                    json.dump(self.gui_state, f)
+            except OSError as e:
+                self.logger.warning(f"Could not save {GUI_STATE_PATH}: {e}")
+        return folder
+
     def browse_output(self):
-        folder = filedialog.askdirectory()
+        folder = self._ask_folder("last_output_folder", "Select Output Folder")
         if folder:
             self.output_folder.set(folder)
 
     def browse_source(self):
-        folder = filedialog.askdirectory()
+        folder = self._ask_folder("last_source_folder", "Select Source Folder")
         if folder:
             self.source_folder.set(folder)
             self.update_video_list()
@@ -1236,15 +1885,19 @@ class VideoEditorGUI:
         self.video_listbox.delete(0, tk.END)
         folder = self.source_folder.get()
         if (folder):
-            video_files = [f for f in os.listdir(folder) 
-                          if f.lower().endswith((".mp4", ".mov"))]
-            for video in sorted(video_files):  # Sort the files alphabetically
-                self.video_listbox.insert(tk.END, video)
+            with os.scandir(folder) as entries:
+                video_files = sorted(entry.name for entry in entries  # Sort the files alphabetically
+                                     if entry.is_file() and is_video_file(entry.name))
+            if video_files:
+                # One Tcl call for the whole list
+                self.video_listbox.insert(tk.END, *video_files)
             
-            # Select and preview the first video if available
+            # Select the first video; preview it once the GUI is idle, unless the
+            # folder is large or auto-preview is off
             if video_files:
                 self.video_listbox.select_set(0)
-                self.preview_selected()
+                if self.auto_preview.get() and len(video_files) <= self.AUTO_PREVIEW_MAX_VIDEOS:
+                    self.root.after_idle(self.preview_selected)
 
     def select_all_videos(self):
         """Select all videos in the listbox"""
@@ -1257,8 +1910,16 @@ class VideoEditorGUI:
     def remove_selected_videos(self):
         """Remove selected videos from the listbox"""
         selected = self.video_listbox.curselection()
-        for index in reversed(selected):
-            self.video_listbox.delete(index)
+        # Delete runs of adjacent rows with one Tcl call each, last run first
+        # so earlier indices stay valid
+        runs = []
+        for index in selected:
+            if runs and index == runs[-1][1] + 1:
+                runs[-1][1] = index
+            else:
+                runs.append([index, index])
+        for first, last in reversed(runs):
+            self.video_listbox.delete(first, last)
 
     def process_selected_video(self):
         """Process only the currently selected video"""
@@ -1273,11 +1934,10 @@ class VideoEditorGUI:
         self.processing = True
         self.process_button.config(state=tk.DISABLED)
         self.status_label.config(text="Processing video...")
+        self._set_progress_busy(True)
         
-        # Start processing in a separate thread
-        thread = threading.Thread(target=lambda: self.process_videos(single_video=True))
-        thread.daemon = True
-        thread.start()
+        # Hand the job to the processing thread
+        self._jobs.put(self._processing_job([self.video_listbox.get(selected[-1])]))
 
     def on_listbox_select(self, event):
         """Handle listbox selection event"""
@@ -1288,7 +1948,19 @@ class VideoEditorGUI:
             video_path = os.path.join(self.source_folder.get(), selected_video)
             if video_path != self.current_preview_video:
                 self.current_preview_video = video_path
-                self.preview_panel.update_preview(video_path=video_path, settings=self.session_settings, dimensions=self.current_dimensions)
+                self._schedule_preview(video_path=video_path, settings=self.session_settings, dimensions=self.current_dimensions)
+
+    def _schedule_preview(self, **kwargs):
+        """Coalesce preview updates arriving within 150 ms into one update_preview call"""
+        self._pending_preview.update(kwargs)
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(150, self._flush_preview)
+
+    def _flush_preview(self):
+        self._preview_after_id = None
+        kwargs, self._pending_preview = self._pending_preview, {}
+        self.preview_panel.update_preview(**kwargs)
 
     def preview_selected(self):
         """Preview the currently selected video"""
@@ -1301,22 +1973,26 @@ class VideoEditorGUI:
                 self.preview_panel.update_preview(video_path=video_path, settings=self.session_settings, dimensions=self.current_dimensions)
 
     def show_settings(self):
-        dialog = CustomSettingsDialog(self.root, 
-                                    lambda s: self.preview_panel.update_preview(settings=s),
-                                    self.session_settings)
-        self.root.wait_window(dialog.dialog)
-        if dialog.result:
+        # Pick up an icon edited since the last dialog
+        self.preview_panel.refresh_icon()
+        # The dialog debounces typing itself, so previews go straight through
+        CustomSettingsDialog(self.root, 
+                             lambda s: self.preview_panel.update_preview(settings=s),
+                             self.session_settings,
+                             on_close=self.on_settings_closed)
+
+    def on_settings_closed(self, result):
+        """Apply the settings from a closed CustomSettingsDialog"""
+        if result:
             # Preserve text overlays when updating settings
-            self.session_settings.update(dialog.result)
+            self.session_settings.update(result)
             self.session_settings['text_overlays'] = self.text_overlays
-            
-            # Update preview with complete settings including text overlays
-            self.preview_panel.update_preview(
-                settings=self.session_settings,
-                dimensions=self.current_dimensions
-            )
-            return self.session_settings
-        return None
+        
+        # Show the session settings (also restores the preview after Cancel)
+        self._schedule_preview(
+            settings=self.session_settings,
+            dimensions=self.current_dimensions
+        )
 
     def show_advanced_settings(self):
         settings_window = tk.Toplevel(self.root)
@@ -1331,11 +2007,13 @@ class VideoEditorGUI:
     def show_text_overlays(self):
         dialog = TextOverlayDialog(self.root, 
                                  self.update_text_overlays,
-                                 preview_callback=self.preview_text_overlays)
+                                 preview_callback=self.preview_text_overlays,
+                                 on_close=self.on_text_overlays_closed)
         dialog.overlays = self.text_overlays.copy()
         dialog.update_list()
-        self.root.wait_window(dialog.dialog)
-        self.text_overlays = dialog.overlays
+
+    def on_text_overlays_closed(self, overlays):
+        self.text_overlays = overlays
 
     def update_text_overlays(self, overlays):
         """Update text overlays and refresh preview"""
@@ -1345,7 +2023,7 @@ class VideoEditorGUI:
             self.session_settings['text_overlays'] = self.text_overlays
             
             # Update preview with complete settings
-            self.preview_panel.update_preview(
+            self._schedule_preview(
                 settings=self.session_settings,
                 dimensions=self.current_dimensions,
                 video_path=self.current_preview_video
@@ -1365,13 +2043,27 @@ class VideoEditorGUI:
             )
 
     def update_progress(self, value):
-        self.progress.set(value)
-        self.root.update_idletasks()
+        """Report progress from any thread; check_queue applies it on the Tk thread"""
+        self.post_update("progress", value)
         
+    def _set_progress_busy(self, busy):
+        """Pulse the progress bar until the first batch reports real progress"""
+        if busy == (str(self.progress_bar.cget('mode')) == 'indeterminate'):
+            return
+        if busy:
+            self.progress.set(0)
+            self.progress_bar.config(mode='indeterminate')
+            self.progress_bar.start(50)
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode='determinate')
+            self.progress.set(0)  # Drop the value left by pulsing
+
     def process_complete(self):
         """Handle completion of video processing"""
         try:
             self.processing = False
+            self._set_progress_busy(False)
             self.process_button.config(state=tk.NORMAL)
             self.status_label.config(text="Processing complete!")
             # Use after() to avoid blocking
@@ -1390,69 +2082,148 @@ class VideoEditorGUI:
         self.processing = True
         self.process_button.config(state=tk.DISABLED)
         self.status_label.config(text="Processing videos...")
+        self._set_progress_busy(True)
+        
+        # Process the selected videos, or all of them when none is selected
+        selected = self.video_listbox.curselection() or range(self.video_listbox.size())
+        video_files = [self.video_listbox.get(idx) for idx in selected]
+        
+        # Hand the job to the processing thread
+        self._jobs.put(self._processing_job(video_files))
+        
+    def _processing_job(self, video_files):
+        """Snapshot everything process_videos needs from the widgets (Tk thread only)"""
+        platform = self.platform.get()
+        return {
+            'video_files': video_files,
+            'use_defaults': self.use_defaults.get(),
+            'platform': platform,
+            'settings': self.preview_panel.get_current_settings(),
+            'target_dimensions': self.current_dimensions,
+            'source_folder': self.source_folder.get(),
+            # Use custom output folder if specified
+            'output_folder': self.output_folder.get() or os.path.join(SCRIPT_DIR, "ai.waverider", platform),
+            # The dialogs may edit the list while jobs run
+            'text_overlays': list(self.text_overlays),
+        }
         
-        # Start processing in a separate thread
-        thread = threading.Thread(target=self.process_videos)
-        thread.daemon = True
-        thread.start()
-        
+    def post_update(self, update_type, value=None):
+        """Queue an update from the processing thread and wake the main loop to apply it"""
+        self.update_queue.put((update_type, value))
+        if self._closing:
+            return
+        if self.tcl_threaded and not self._wakeup_pending:
+            self._wakeup_pending = True
+            try:
+                # Tkinter marshals this call onto the Tk thread
+                self.root.event_generate("<<UpdateQueue>>", when="tail")
+            except (tk.TclError, RuntimeError):
+                # The window closed while this call was on its way
+                if not self._closing:
+                    raise
+
     def check_queue(self):
-        """Check for updates from the processing thread"""
+        """Apply updates queued by the processing thread"""
+        # Clear before draining so an update queued meanwhile sends a new wakeup
+        self._wakeup_pending = False
+        progress = None
+        logs = []
+        errors = []
+        complete = False
+        icon_results = []
+        deferred = False
         try:
-            while True:
+            for _ in range(self.QUEUE_DRAIN_MAX):
                 update_type, value = self.update_queue.get_nowait()
                 if update_type == "progress":
-                    self.progress.set(value)
+                    progress = value
                 elif update_type == "log":
-                    self.log_display.config(state='normal')
-                    self.log_display.insert(tk.END, f"{value}\n")
-                    self.log_display.see(tk.END)
-                    self.log_display.config(state='disabled')
+                    logs.append(f"{value}\n")
+                elif update_type == "error":
+                    errors.append(value)
                 elif update_type == "complete":
-                    self.process_complete()
+                    complete = True
+                elif update_type == "icon":
+                    icon_results.append(value)
+            else:
+                deferred = not self.update_queue.empty()
         except queue.Empty:
             pass
         finally:
-            self.root.after(100, self.check_queue)
-
-    def get_custom_settings(self):
-        dialog = CustomSettingsDialog(self.root, 
-                                    lambda s: self.preview_panel.update_preview(settings=s))
-        self.root.wait_window(dialog.dialog)
-        return dialog.result
+            # Apply everything drained this tick with one widget update each
+            if progress is not None:
+                self._set_progress_busy(False)
+                self.progress.set(progress)
+            if logs:
+                # Only follow new output when the view is already at the bottom
+                at_bottom = self.log_display.yview()[1] >= 1.0
+                self.log_display.config(state='normal')
+                self.log_display.insert(tk.END, "".join(logs))
+                # Keep about the newest LOG_MAX_LINES lines so long batches stay responsive
+                line_count = int(self.log_display.index('end-1c').split('.')[0])
+                if line_count > self.LOG_MAX_LINES + self.LOG_TRIM_LINES:
+                    self.log_display.delete('1.0', f'{line_count - self.LOG_MAX_LINES}.0')
+                if at_bottom:
+                    self.log_display.see(tk.END)
+                self.log_display.config(state='disabled')
+            for icon in icon_results:
+                self._apply_brand_icon(icon)
+            for message in errors:
+                messagebox.showerror("Error", message)
+            if complete:
+                self.process_complete()
+            if not self.tcl_threaded:
+                self.root.after(self.poll_ms, self.check_queue)
+            elif deferred and not self._wakeup_pending:
+                # Let Tk redraw before applying the backlog
+                self._wakeup_pending = True
+                self.root.after(1, self.check_queue)
+
+    def get_custom_settings(self, on_result=None):
+        """Open a CustomSettingsDialog; on_result(settings or None) runs when it closes"""
+        # Pick up an icon edited since the last dialog
+        self.preview_panel.refresh_icon()
+        CustomSettingsDialog(self.root, 
+                             lambda s: self.preview_panel.update_preview(settings=s),
+                             on_close=on_result)
 
     def on_aspect_ratio_changed(self, *args):
-        ratio_dimensions = {
-            "1": (1080, 1080),
-            "2": (1080, 1920),
-            "3": (1920, 1080),
-            "4": self.current_dimensions  # Custom dimensions
-        }
-        self.current_dimensions = ratio_dimensions[self.aspect_ratio.get()]
-        self.preview_panel.update_preview(dimensions=dimensions, settings=self.session_settings, video_path=self.current_preview_video)
-
-    def process_videos(self, single_video=False):
+        # Custom ratio ("4") keeps the current dimensions
+        self.current_dimensions = self.RATIO_DIMENSIONS.get(self.aspect_ratio.get(), self.current_dimensions)
+        self._schedule_preview(dimensions=self.current_dimensions, settings=self.session_settings, video_path=self.current_preview_video)
+
+    def get_config_parameters(self, platform):
+        """Return the config-derived parameters for a platform, deriving them once"""
+        params = self._param_cache.get(platform)
+        if params is None:
+            platform_defaults = get_platform_defaults(self.config, platform)
+            params = get_parameters_from_config(self.config, platform_defaults)
+            self._param_cache[platform] = params
+        return params
+
+    def process_videos(self, video_files, use_defaults, platform, settings, target_dimensions,
+                       source_folder, output_folder, text_overlays):
+        """Encode video_files on the processing thread.
+
+        The arguments are read from the widgets on the Tk thread (see
+        _processing_job); this method only reports back through post_update.
+        """
         try:
-            platform_defaults = get_platform_defaults(self.config, self.platform.get())
-            
-            if self.use_defaults.get() and self.config:
+            if use_defaults and self.config:
                 video_position_params, top_bg_params, black_bg_params, icon_params = \
-                    get_parameters_from_config(self.config, platform_defaults)
+                    self.get_config_parameters(platform)
             else:
                 # Use the current settings from preview panel
-                settings = self.preview_panel.get_current_settings()
                 if not settings:
-                    messagebox.showerror("Error", "Please configure settings first")
-                    self.update_queue.put(("complete", None))
-                    self.processing = False
-                    self.process_button.config(state=tk.NORMAL)
+                    self.post_update("error", "Please configure settings first")
+                    self.post_update("complete", None)
                     return
                 
                 # Convert settings to the correct parameter format with proper opacity values
                 if settings['video_position']['enabled']:
                     video_position_params = {
                         'bottom_height_percent': float(settings['video_position']['height']),
-                        'opacity': min(1.0, max(0.0, float(settings['video_position']['opacity'])))  # Ensure 0-1 range
+                        'opacity': _clamp01(settings['video_position']['opacity'])
                     }
                 else:
                     video_position_params = None
@@ -1460,7 +2231,7 @@ class VideoEditorGUI:
                 if settings['top_bg']['enabled']:
                     top_bg_params = {
                         'height_percent': float(settings['top_bg']['height']),
-                        'opacity': min(1.0, max(0.0, float(settings['top_bg']['opacity'])))  # Ensure 0-1 range
+                        'opacity': _clamp01(settings['top_bg']['opacity'])
                     }
                 else:
                     top_bg_params = None
@@ -1468,7 +2239,7 @@ class VideoEditorGUI:
                 if settings['bottom_bg']['enabled']:
                     black_bg_params = {
                         'height_percent': float(settings['bottom_bg']['height']),
-                        'opacity': min(1.0, max(0.0, float(settings['bottom_bg']['opacity'])))  # Ensure 0-1 range
+                        'opacity': _clamp01(settings['bottom_bg']['opacity'])
                     }
                 else:
                     black_bg_params = None
@@ -1477,7 +2248,7 @@ class VideoEditorGUI:
                 icon_params = {
                     'width': int(settings['icon']['width']),
                     'x_position': settings['icon']['x_position'],
-                    'y_position': min(100.0, max(0.0, float(settings['icon']['y_position'])))  # Ensure 0-100 range
+                    'y_position': _clamp100(settings['icon']['y_position'])
                 }
 
             # Log the parameters for debugging
@@ -1486,134 +2257,80 @@ class VideoEditorGUI:
             self.logger.info(f"Top background: {top_bg_params}")
             self.logger.info(f"Bottom background: {black_bg_params}")
             self.logger.info(f"Icon: {icon_params}")
-            self.logger.info(f"Text overlays: {self.text_overlays}")
-
-            # Set target dimensions based on aspect ratio
-            ratio_dimensions = {
-                "1": (1080, 1080),
-                "2": (1080, 1920),
-                "3": (1920, 1080),
-                "4": self.current_dimensions  # Custom dimensions
-            }
-            target_dimensions = ratio_dimensions[self.aspect_ratio.get()]
-            
-            # Process videos
-            source_folder = self.source_folder.get()
-            
-            # Use custom output folder if specified
-            if self.output_folder.get():
-                output_folder = self.output_folder.get()
-            else:
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                output_folder = os.path.join(script_dir, "ai.waverider", self.platform.get())
-            
+            self.logger.info(f"Text overlays: {text_overlays}")
+
             os.makedirs(output_folder, exist_ok=True)
             
-            brand_icon = "assets/fullicon.png"
-            if not os.path.isfile(brand_icon):
-                raise FileNotFoundError(f"Brand icon not found at '{brand_icon}'")
-            
-            # Get list of videos to process
-            if single_video:
-                selected = self.video_listbox.curselection()
-                if not selected:
-                    raise ValueError("No video selected")
-                video_files = [self.video_listbox.get(selected[-1])]
-            else:
-                selected = self.video_listbox.curselection()
-                if not selected:
-                    video_files = [self.video_listbox.get(idx) for idx in range(self.video_listbox.size())]
-                else:
-                    video_files = [self.video_listbox.get(idx) for idx in selected]
+            brand_icon = self.brand_icon
             
-            for i, video_file in enumerate(video_files):
-                input_path = os.path.join(source_folder, video_file)
-                output_path = os.path.join(output_folder, f"processed_{video_file}")
-                
-                # Process single video with text overlays
-                process_video((
-                    input_path, brand_icon, output_path, target_dimensions,
-                    black_bg_params, video_position_params, top_bg_params, 
-                    icon_params, self.text_overlays
-                ))
+            # Each job only waits on its own FFmpeg process, so run a few at
+            # once (see max_parallel_jobs).
+            # Videos share one set of settings, so each job encodes up to
+            # SHORTS_VIDEOS_PER_FFMPEG of them in a single FFmpeg process to
+            # avoid paying FFmpeg/NVENC start-up for every clip
+            max_parallel = max_parallel_jobs()
+            batch_size = max(1, min(int(os.environ.get("SHORTS_VIDEOS_PER_FFMPEG", 2)), max_parallel))
+            input_paths = [os.path.join(source_folder, video_file) for video_file in video_files]
+            output_paths = [os.path.join(output_folder, "processed_" + video_file) for video_file in video_files]
+            job_args = (
+                target_dimensions, black_bg_params, video_position_params, top_bg_params,
+                icon_params, text_overlays, self.encoder_args
+            )
+            batch_starts = range(0, len(video_files), batch_size)
+            max_workers = max(1, min(max_parallel // batch_size, len(batch_starts)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Process each batch with text overlays
+                futures = {
+                    executor.submit(process_video_batch, (
+                        input_paths[start:start + batch_size], brand_icon,
+                        output_paths[start:start + batch_size], *job_args
+                    )): video_files[start:start + batch_size]
+                    for start in batch_starts
+                }
+                self._batch_futures = tuple(futures)
+                if self._closing:
+                    # The window closed while the batches were being queued
+                    for future in futures:
+                        future.cancel()
                 
-                # Update progress through queue
-                progress = (i + 1) / len(video_files) * 100
-                self.update_queue.put(("progress", progress))
-                self.update_queue.put(("log", f"Processed: {video_file}"))
+                try:
+                    done = 0
+                    total = len(video_files)
+                    last_percent = -1
+                    for future in as_completed(futures):
+                        future.result()
+                        
+                        # Update progress through queue, only when the whole percent changes
+                        done += len(futures[future])
+                        percent = done * 100 // total
+                        if percent != last_percent:
+                            self.post_update("progress", percent)
+                            last_percent = percent
+                        for video_file in futures[future]:
+                            self.post_update("log", f"Processed: {video_file}")
+                except Exception:
+                    # Stop queued jobs after the first failure, as the sequential loop did
+                    for future in futures:
+                        future.cancel()
+                    raise
+                finally:
+                    self._batch_futures = ()
                 
-            self.update_queue.put(("complete", None))
+            self.post_update("complete", None)
             
         except subprocess.CalledProcessError as e:
             error_message = f"FFmpeg error: {e.stderr}"
             self.logger.error(f"Error during processing: {error_message}")
-            self.update_queue.put(("log", f"Error: {error_message}"))
-            self.update_queue.put(("complete", None))
+            self.post_update("log", f"Error: {error_message}")
+            self.post_update("complete", None)
         except Exception as e:
             self.logger.error(f"Error during processing: {str(e)}")
-            self.update_queue.put(("log", f"Error: {str(e)}"))
-            self.update_queue.put(("complete", None))
+            self.post_update("log", f"Error: {str(e)}")
+            self.post_update("complete", None)
         finally:
+            # Widgets are only touched on the Tk thread; process_complete
+            # re-enables the button when the "complete" update arrives
             self.processing = False
-            self.process_button.config(state=tk.NORMAL)
-
-def process_video(video_args):
-    """
-    Process a single video with proper UTF-8 encoding handling.
-    """
-    input_path, brand_icon, output_path, target_dimensions, black_bg_params, \
-    video_position_params, top_bg_params, icon_params, text_overlays = video_args  # Add text_overlays
-    
-    filter_complex = generate_filter_complex(
-        input_path, brand_icon, target_dimensions, black_bg_params,
-        video_position_params, top_bg_params, icon_params, text_overlays  # Add text_overlays
-    )
-
-    command = [
-        "ffmpeg",
-        "-i", input_path,
-        "-i", brand_icon,
-        "-filter_complex", filter_complex,
-        "-map", "[out]",      # Explicitly map the final output
-        "-map", "0:a?",       # Map audio if present
-        "-c:v", "h264_nvenc",
-        "-preset", "p4",
-        "-cq", "20",
-        "-c:a", "copy",
-        "-y",
-        output_path
-    ]
-
-    try:
-        # Run FFmpeg and capture output for debugging
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,  # Enables text mode with universal newlines
-            encoding='utf-8',         # Specify UTF-8 encoding
-            errors='replace'          # Replace invalid characters instead of failing
-        )
-        
-        # Wait for the process to complete and get output
-        stdout, stderr = process.communicate()
-        
-        if process.returncode != 0:
-            raise subprocess.CalledProcessError(
-                process.returncode, 
-                command, 
-                output=stdout, 
-                stderr=stderr
-            )
-            
-        return output_path
-        
-    except subprocess.CalledProcessError as e:
-        print(f"[ERROR] FFmpeg failed for {input_path}:\n{e.stderr}")
-        raise e
-    except Exception as e:
-        print(f"[ERROR] Unexpected error processing {input_path}: {str(e)}")
-        raise e
 
 def main():
     root = tk.Tk()